@@ -22,6 +22,11 @@ SECTOR_NORMALIZATION = {
     "Basic Materials": "Materials",
 }
 
+# raw or normalized sector name -> ETF, so callers need a single lookup
+NORMALIZED_SECTOR_TO_ETF = SECTOR_TO_ETF | {
+    raw: SECTOR_TO_ETF[norm] for raw, norm in SECTOR_NORMALIZATION.items() if norm in SECTOR_TO_ETF
+}
+
 ALL_SECTORS = set(SECTOR_TO_ETF.keys())
 
 GROUP_PREFIXES = {
@@ -154,13 +154,13 @@ def fetch_and_save_macro(
     end_year: int = _pyd.today().year,
     output_root: str = "features_data"
 ) -> str:
-    macro_api = WorldBankAPI()
-    df_raw = macro_api.fetch_macro_indicators(
-        indicator_map=MACRO_INDICATORS,
-        country_name=country,
-        start=start_year,
-        end=end_year
-    )
+    with WorldBankAPI() as macro_api:  # closes the pooled session once the download is done
+        df_raw = macro_api.fetch_macro_indicators(
+            indicator_map=MACRO_INDICATORS,
+            country_name=country,
+            start=start_year,
+            end=end_year
+        )
 
     df = pl.from_pandas(df_raw.reset_index())
     df = df.with_columns(pl.col("date").cast(pl.Date))
@@ -13,6 +13,7 @@ from tqdm import tqdm
 
 from src.dataprep.fetcher._fmp_client import fmp_get
 from src.dataprep.fetcher.ticker_data_sources import fetch_all_per_ticker
+from src.dataprep.fetcher.ticker_params.dividends import warm_ticker_caches
 from src.dataprep.features.aggregation.ticker_row_builder import build_feature_table_from_inputs
 from src.dataprep.features.aggregation.validate_dynamic_row import validate_dynamic_row
 from src.dataprep.constants import EXPECTED_COLUMNS
@@ -499,6 +500,22 @@ def generate_features_for_ticker(
     return logs, changed, stats
 
 
+def tickers_with_missing_dates(tickers: list[str], dates: list[date]) -> list[str]:
+    """Tickers for which generate_features_for_ticker would build at least one date."""
+    pending = []
+    for ticker in tickers:
+        out_fp = Path(OUTPUT_DIR) / f"{ticker}.parquet"
+        if out_fp.exists():
+            try:
+                existing = set(pl.read_parquet(out_fp, columns=["as_of"])["as_of"].to_list())
+            except Exception:
+                existing = set()  # unreadable/legacy file: leave it to the per-ticker pass
+            if existing.issuperset(dates):
+                continue
+        pending.append(ticker)
+    return pending
+
+
 def has_enough_price_data(inputs: dict, as_of: date, required_days: int = 260) -> bool:
     if "prices" not in inputs:
         return False
@@ -598,6 +615,10 @@ def main():
     # seed progress at 0%
     _update_progress_live(STATUS_DIR, totals, counts, note="starting")
 
+    # dividend histories and splits are independent per ticker: download them up front, concurrently,
+    # but only for tickers with dates still to build, and no faster than the per-ticker throttle
+    warm_ticker_caches(tickers_with_missing_dates(tickers, all_dates), min_interval=SLEEP_BETWEEN_CALLS)
+
     for ticker in tqdm(tickers, desc="Processing tickers"):
         logs, changed, tstats = generate_features_for_ticker(ticker, all_dates, on_progress=_on_progress)
         any_changed = any_changed or changed
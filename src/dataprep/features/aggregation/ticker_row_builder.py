@@ -3,9 +3,9 @@ from datetime import date
 import numpy as np
 
 from src.dataprep.features.engineering import (
-    compute_6m_return, compute_12m_return, compute_volatility, compute_max_drawdown,
+    compute_price_features_batch,
     compute_net_debt_to_ebitda, compute_ebit_interest_cover,
-    compute_dividend_cagr, compute_yield_vs_median,
+    compute_dividend_cagrs, compute_yield_vs_median,
     compute_eps_cagr, compute_fcf_cagr,
     extract_latest_pe_pfcf, compute_payout_ratio,
     compute_sector_relative_return,
@@ -44,6 +44,7 @@ def build_feature_table_from_inputs(ticker: str, inputs: dict, as_of: date) -> t
     df_fundamentals = compute_ebit_interest_cover(df_fundamentals)
 
     pe, pfcf = extract_latest_pe_pfcf(ratios)
+    dividend_cagr = compute_dividend_cagrs(dividends, splits, years=[3, 5])
     if sector_df is not None and not sector_df.is_empty():
         rel_return = compute_sector_relative_return(prices, sector_df, 365, as_of)
     else:
@@ -52,10 +53,7 @@ def build_feature_table_from_inputs(ticker: str, inputs: dict, as_of: date) -> t
 
     dynamic_features = {
         "as_of": as_of,
-        "6m_return": compute_6m_return(prices, as_of),
-        "12m_return": compute_12m_return(prices, as_of),
-        "volatility": compute_volatility(prices),
-        "max_drawdown_1y": compute_max_drawdown(df=prices, lookback_years=1),
+        **compute_price_features_batch(prices, as_of, lookback_years=1),
         "sector_relative_6m": rel_return,
         "sma_50_200_delta": compute_sma_delta_50_250(prices),
 
@@ -67,8 +65,8 @@ def build_feature_table_from_inputs(ticker: str, inputs: dict, as_of: date) -> t
         "fcf_cagr_3y": compute_fcf_cagr(ratios, years=3),
 
         "dividend_yield": safe_get(ratios, "dividendYield"),
-        "dividend_cagr_3y": compute_dividend_cagr(dividends, splits, years=3),
-        "dividend_cagr_5y": compute_dividend_cagr(dividends, splits, years=5),
+        "dividend_cagr_3y": dividend_cagr[3],
+        "dividend_cagr_5y": dividend_cagr[5],
         "yield_vs_5y_median": compute_yield_vs_median(ratios, lookback_years=5),
 
         "pe_ratio": pe,
@@ -5,19 +5,21 @@ from src.dataprep.features.engineering.price_features import (
     compute_payout_ratio,
     compute_volatility,
     compute_max_drawdown,
+    compute_price_features_batch,
     compute_sma_delta_50_250
 )
-from src.dataprep.features.engineering.metadata_features import encode_sector
 from src.dataprep.features.engineering.utils import (
     ensure_date_column, 
     find_nearest_price, 
+    find_nearest_prices,
     adjust_series_for_splits
 )
 from src.dataprep.features.engineering.dividend_features import compute_yield_vs_median
 from src.dataprep.features.engineering.growth_features import (
     compute_eps_cagr,
     compute_fcf_cagr,
-    compute_dividend_cagr
+    compute_dividend_cagr,
+    compute_dividend_cagrs
 )
 from src.dataprep.features.engineering.fundamental_features import (
     compute_net_debt_to_ebitda,
@@ -28,5 +30,9 @@ from src.dataprep.features.engineering.valuation_features import \
 
 from src.dataprep.features.engineering.static_features import (
     encode_country,
-    encode_sector
+    encode_sector,
+    encode_countries,
+    encode_sectors,
+    SECTOR_COLUMNS,
+    COUNTRY_COLUMNS
 )
\ No newline at end of file
@@ -2,12 +2,14 @@ import polars as pl
 import datetime
 import numpy as np
 
+from src.dataprep.features.engineering.utils import ensure_date_column
+
 def compute_yield_vs_median(df: pl.DataFrame, lookback_years: int, grace_days: int = 90) -> float:
     if df.height < 2 or "dividendYield" not in df.columns or "date" not in df.columns:
         return np.nan
 
     if df.schema["date"] == pl.Utf8:
-        df = df.with_columns(pl.col("date").str.strptime(pl.Date, "%Y-%m-%d"))
+        df = ensure_date_column(df, "date")
 
     df = df.drop_nulls("date").sort("date")
 
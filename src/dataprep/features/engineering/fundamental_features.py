@@ -1,17 +1,18 @@
 import polars as pl
 import logging
 import numpy as np
+from functools import lru_cache
 
-def compute_net_debt_to_ebitda(df: pl.DataFrame) -> pl.DataFrame:
-    """
-    Computes Net Debt / EBITDA ratio.
-    EBITDA is approximated as:
-        EBITDA = incomeBeforeTax + interestExpense + depreciationAndAmortization
+_NET_DEBT_TO_EBITDA_INPUTS = (
+    "incomeBeforeTax", "interestExpense", "depreciationAndAmortization",
+    "totalDebt", "cashAndShortTermInvestments",
+)
 
-    Returns the original DataFrame with a new column: 'net_debt_to_ebitda'.
-    """
+
+@lru_cache(maxsize=32)
+def _net_debt_to_ebitda_expr(present: frozenset[str]) -> pl.Expr:
     def safe_col(name: str):
-        return pl.col(name) if name in df.columns else pl.lit(0)
+        return pl.col(name) if name in present else pl.lit(0)
 
     # Approximate EBITDA
     ebitda_expr = (
@@ -24,12 +25,25 @@ def compute_net_debt_to_ebitda(df: pl.DataFrame) -> pl.DataFrame:
 
     ratio_expr = net_debt_expr / ebitda_expr
 
-    return df.with_columns([
+    return (
         pl.when(ratio_expr.is_finite())
           .then(ratio_expr)
           .otherwise(None)
           .alias("net_debt_to_ebitda")
-    ])
+    )
+
+
+def compute_net_debt_to_ebitda(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Computes Net Debt / EBITDA ratio.
+    EBITDA is approximated as:
+        EBITDA = incomeBeforeTax + interestExpense + depreciationAndAmortization
+
+    Returns the original DataFrame with a new column: 'net_debt_to_ebitda'.
+    """
+    # The expression only depends on which inputs exist, so build it once per schema shape
+    present = frozenset(_NET_DEBT_TO_EBITDA_INPUTS).intersection(df.columns)
+    return df.with_columns([_net_debt_to_ebitda_expr(present)])
 
 
 def compute_ebit_interest_cover(df: pl.DataFrame, cap: float = 1000.0) -> pl.DataFrame:
@@ -43,25 +57,17 @@ def compute_ebit_interest_cover(df: pl.DataFrame, cap: float = 1000.0) -> pl.Dat
         raise ValueError("Missing both 'operatingIncome' and 'incomeBeforeTax'. Cannot compute EBIT.")
 
     # Handle interest expense column
-    interest_col = pl.col("interestExpense") if "interestExpense" in df.columns else pl.lit(None)
-
-    # Raw EBIT / interest
-    raw_expr = pl.when(interest_col.is_not_null() & (interest_col != 0)) \
-                 .then(ebit_col / interest_col) \
-                 .otherwise(None)
-
-    # Capped EBIT / interest
-    capped_expr = pl.when(raw_expr < cap).then(raw_expr).otherwise(np.inf)
-
-    # Cap flag
-    cap_applied_expr = pl.when(raw_expr.is_null() | (raw_expr >= cap)).then(True).otherwise(False)
+    interest_col = pl.col("interestExpense") if "interestExpense" in df.columns else pl.lit(None, dtype=pl.Float64)
 
-    # Validity indicator
-    has_ebit_interest_cover = raw_expr.is_not_null().alias("has_ebit_interest_cover")
+    # Raw EBIT / interest (null when interest is missing or zero); materialized once
+    df = df.with_columns((ebit_col / interest_col.replace(0, None)).alias("ebit_interest_cover_raw"))
+    raw = pl.col("ebit_interest_cover_raw")
 
     return df.with_columns([
-        raw_expr.alias("ebit_interest_cover_raw"),
-        capped_expr.alias("ebit_interest_cover"),
-        cap_applied_expr.alias("ebit_interest_cover_capped"),
-        has_ebit_interest_cover
+        # Capped EBIT / interest
+        pl.when(raw < cap).then(raw).otherwise(np.inf).alias("ebit_interest_cover"),
+        # Cap flag
+        (raw.is_null() | (raw >= cap)).alias("ebit_interest_cover_capped"),
+        # Validity indicator
+        raw.is_not_null().alias("has_ebit_interest_cover"),
     ])
@@ -7,6 +7,19 @@ from src.dataprep.features.engineering.utils import adjust_series_for_splits
 import numpy as np
 
 
+def _grace_window(
+    target_date: datetime.date,
+    grace_days: int = None,
+    grace_months: int = None,
+) -> tuple[datetime.date, datetime.date]:
+    if grace_days:
+        return target_date - timedelta(days=grace_days), target_date + timedelta(days=grace_days)
+    if grace_months:
+        grace = relativedelta(months=grace_months)
+        return target_date - grace, target_date + grace
+    raise ValueError("You must specify either grace_days or grace_months")
+
+
 def find_value_near_date(
     df: pl.DataFrame,
     target_date: datetime.date,
@@ -14,19 +27,23 @@ def find_value_near_date(
     grace_days: int = None,
     grace_months: int = None,
 ) -> float | None:
-    if grace_days:
-        lower = target_date - timedelta(days=grace_days)
-        upper = target_date + timedelta(days=grace_days)
-    elif grace_months:
-        lower = target_date - relativedelta(months=grace_months)
-        upper = target_date + relativedelta(months=grace_months)
-    else:
-        raise ValueError("You must specify either grace_days or grace_months")
-
+    lower, upper = _grace_window(target_date, grace_days, grace_months)
     window = df.filter((pl.col("date") >= lower) & (pl.col("date") <= upper))
     return window[-1, column] if not window.is_empty() else None
 
 
+def _last_value_in_window(
+    dates: np.ndarray,
+    values: np.ndarray,
+    lower: datetime.date,
+    upper: datetime.date,
+) -> float | None:
+    # `dates` must be sorted ascending; two binary searches bound the window
+    lo = np.searchsorted(dates, np.datetime64(lower, "D"), side="left")
+    hi = np.searchsorted(dates, np.datetime64(upper, "D"), side="right")
+    return values[hi - 1] if hi > lo else None
+
+
 def compute_cagr_generic(
     df: pl.DataFrame,
     column: str,
@@ -38,41 +55,58 @@ def compute_cagr_generic(
         return np.nan
 
     df = df.sort("date")
+    dates = df["date"].to_numpy()
+    values = df[column].cast(pl.Float64).to_numpy()
     end_date = df[-1, "date"]
-    end_val = df[-1, column]
+    end_val = values[-1]
 
     start_date = end_date - timedelta(days=365 * years)
-    start_val = find_value_near_date(
-        df, start_date, column, grace_days=grace_days, grace_months=grace_months
-    )
+    lower, upper = _grace_window(start_date, grace_days, grace_months)
+    start_val = _last_value_in_window(dates, values, lower, upper)
 
-    if start_val is None or start_val <= 0 or end_val <= 0:
+    if start_val is None or not (start_val > 0 and end_val > 0):
         return np.nan
 
     try:
-        return (end_val / start_val) ** (1 / years) - 1
+        return float((end_val / start_val) ** (1 / years) - 1)
     except Exception as e:
         logging.warning(f"[CAGR] Failed to compute CAGR for {column}: {e}")
         return np.nan
 
 
-def compute_dividend_cagr(
+def compute_dividend_cagrs(
     df: pl.DataFrame,
     splits_df: pl.DataFrame,
-    years: int,
+    years: list[int],
     grace_months: int = 3
-) -> float | None:
+) -> dict[int, float]:
+    """
+    Computes dividend CAGRs for several horizons, split-adjusting the series only once.
+    Returns a mapping of horizon (years) -> CAGR.
+    """
     if splits_df is None:
         raise ValueError("Split DataFrame cannot be None.")
 
     df = df.with_columns(pl.col("date").cast(pl.Date)).sort("date")
 
     if df.height < 2:
-        return np.nan
+        return {y: np.nan for y in years}
 
     df = adjust_series_for_splits(df, splits_df, "dividend", skip_warning=True)
 
-    return compute_cagr_generic(df, column="dividend", years=years, grace_months=grace_months)
+    return {
+        y: compute_cagr_generic(df, column="dividend", years=y, grace_months=grace_months)
+        for y in years
+    }
+
+
+def compute_dividend_cagr(
+    df: pl.DataFrame,
+    splits_df: pl.DataFrame,
+    years: int,
+    grace_months: int = 3
+) -> float | None:
+    return compute_dividend_cagrs(df, splits_df, [years], grace_months)[years]
 
 
 def compute_eps_cagr(df: pl.DataFrame, years: int) -> float | None:
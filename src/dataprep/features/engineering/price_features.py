@@ -1,5 +1,5 @@
 from src.dataprep.features.engineering.utils \
-    import ensure_date_column, find_nearest_price
+    import ensure_date_column, find_nearest_prices
 import polars as pl
 import datetime
 from dateutil.relativedelta import relativedelta
@@ -19,8 +19,7 @@ def compute_return_over_period(
     past_date = as_of_date - period
 
     try:
-        price_now = find_nearest_price(df, as_of_date)
-        price_past = find_nearest_price(df, past_date)
+        price_now, price_past = find_nearest_prices(df, [as_of_date, past_date])
     except ValueError as e:
         logging.warning(e)
         return 0.0
@@ -74,6 +73,66 @@ def compute_max_drawdown(df: pl.DataFrame, lookback_years: int, grace_days: int
     return max_drawdown
 
 
+def compute_price_features_batch(
+    df: pl.DataFrame,
+    as_of_date: datetime.date | None = None,
+    lookback_years: int = 1,
+    grace_days: int = 15
+) -> dict[str, float]:
+    """
+    Computes 6M/12M return, volatility and max drawdown in a single lazy query.
+    Equivalent to calling the four individual functions, but sorts and scans once.
+    """
+    df = ensure_date_column(df, "date")
+    if "close" not in df.columns:
+        raise ValueError("Expected a 'close' column in the DataFrame")
+
+    as_of_date = as_of_date or datetime.date.today()
+    date_6m = as_of_date - relativedelta(months=6)
+    date_12m = as_of_date - relativedelta(years=1)
+
+    close = pl.col("close")
+    dates = pl.col("date")
+    window_start = dates.max() - pl.duration(days=365 * lookback_years + grace_days)
+    window_close = close.filter(dates >= window_start)
+    peak = window_close.cum_max()
+
+    row = (
+        df.lazy()
+        .sort("date")
+        .select(
+            close.filter(dates <= as_of_date).last().alias("price_now"),
+            close.filter(dates <= date_6m).last().alias("price_6m"),
+            close.filter(dates <= date_12m).last().alias("price_12m"),
+            (close / close.shift(1) - 1).std().alias("std_dev"),
+            ((peak - window_close) / peak).max().alias("max_drawdown"),
+            window_close.len().alias("window_rows"),
+        )
+        .collect()
+        .row(0, named=True)
+    )
+
+    def _period_return(price_past, past_date) -> float:
+        price_now = row["price_now"]
+        if price_now is None:
+            logging.warning(f"No price data available on or before {as_of_date}")
+            return 0.0
+        if price_past is None:
+            logging.warning(f"No price data available on or before {past_date}")
+            return 0.0
+        return (price_now - price_past) / price_past
+
+    std_dev = row["std_dev"]
+    max_drawdown = row["max_drawdown"] if row["window_rows"] >= 2 else 0.0
+
+    return {
+        "6m_return": _period_return(row["price_6m"], date_6m),
+        "12m_return": _period_return(row["price_12m"], date_12m),
+        "volatility": 0.0 if std_dev is None else std_dev * (252 ** 0.5),
+        "max_drawdown_1y": max_drawdown or 0.0,
+    }
+
+
 
 def compute_sector_relative_return(
     stock_df: pl.DataFrame,
@@ -86,17 +145,26 @@ def compute_sector_relative_return(
     """
     cutoff = as_of - timedelta(days=lookback_days)
 
-    stock_df = stock_df.filter((pl.col("date") >= cutoff) & (pl.col("date") <= as_of)).sort("date")
-    sector_df = sector_df.filter((pl.col("date") >= cutoff) & (pl.col("date") <= as_of)).sort("date")
-
-    if stock_df.height < 2 or sector_df.height < 2:
+    def _window_ends(df: pl.DataFrame) -> pl.LazyFrame:
+        close = pl.col("close").sort_by("date")
+        return (
+            df.lazy()
+            .filter((pl.col("date") >= cutoff) & (pl.col("date") <= as_of))
+            .select(
+                close.first().alias("start"),
+                close.last().alias("end"),
+                pl.len().alias("rows"),
+            )
+        )
+
+    # Both frames are scanned once, in parallel
+    stock, sector = pl.collect_all([_window_ends(stock_df), _window_ends(sector_df)])
+    stock_start, stock_end, stock_rows = stock.row(0)
+    sector_start, sector_end, sector_rows = sector.row(0)
+
+    if stock_rows < 2 or sector_rows < 2:
         return 0.0
 
-    stock_start = stock_df[0, "close"]
-    stock_end = stock_df[-1, "close"]
-    sector_start = sector_df[0, "close"]
-    sector_end = sector_df[-1, "close"]
-
     if stock_start <= 0 or stock_end <= 0 or sector_start <= 0 or sector_end <= 0:
         return 0.0
 
@@ -107,18 +175,23 @@ def compute_sector_relative_return(
 
 
 def compute_payout_ratio(df: pl.DataFrame) -> float:
-    if "payoutRatio" in df.columns:
-        valid = df.drop_nulls("payoutRatio").filter(pl.col("payoutRatio") > 0)
-        if not valid.is_empty():
-            return valid[-1, "payoutRatio"]
-    return 0.0
+    # latest positive payout ratio by date, without relying on row order
+    if "payoutRatio" not in df.columns:
+        return 0.0
+    positive = pl.col("payoutRatio").filter(pl.col("payoutRatio") > 0)
+    if "date" in df.columns:
+        positive = positive.sort_by(pl.col("date").filter(pl.col("payoutRatio") > 0))
+    value = df.lazy().select(positive.last()).collect().item()
+    return value or 0.0
 
 
 def compute_sma_delta_50_250(prices: pl.DataFrame) -> float:
     # this function computes the difference between the 50-day and 200-day simple moving averages
-    closes = prices.sort("date").select("close").to_series()
-    if len(closes) < 200:
+    if prices.height < 200:
         raise ValueError("Not enough data to compute SMA delta")
-    sma_50 = closes[-50:].mean()
-    sma_200 = closes[-200:].mean()
+    closes = pl.col("close").sort_by("date")
+    sma_50, sma_200 = prices.lazy().select(
+        closes.tail(50).mean().alias("sma_50"),
+        closes.tail(200).mean().alias("sma_200"),
+    ).collect().row(0)
     return (sma_50 - sma_200) / sma_200 if sma_200 != 0 else 0.0
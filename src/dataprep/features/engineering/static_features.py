@@ -1,31 +1,55 @@
 import re
+from functools import lru_cache
+
+import numpy as np
 
 from src.dataprep.constants import ALL_SECTORS, ALL_COUNTRIES
 
 
+@lru_cache(maxsize=None)
 def _slug(s: str) -> str:
     if not s:
         return "unknown"
     s = re.sub(r"[^A-Za-z0-9]+", "_", s.strip()).strip("_").lower()
     return s or "unknown"
 
-def _encode_one_hot(value: str | None, vocab: list[str], prefix: str) -> dict[str, int]:
+def _one_hot_layout(vocab, prefix: str) -> tuple[tuple[str, ...], dict[str, int]]:
+    # column names (vocab order + trailing "<prefix>_other") and value -> column index
+    columns = tuple(f"{prefix}_{_slug(item)}" for item in vocab) + (f"{prefix}_other",)
+    return columns, {item: i for i, item in enumerate(vocab)}
+
+# ALL_SECTORS is a set; sort it so the column order is stable across processes
+SECTOR_COLUMNS, _SECTOR_INDEX = _one_hot_layout(sorted(ALL_SECTORS), "sector")
+COUNTRY_COLUMNS, _COUNTRY_INDEX = _one_hot_layout(ALL_COUNTRIES, "country")
+
+def _one_hot_position(value: str | None, index: dict[str, int], prefix: str) -> int:
     val = (value or "").strip()
     # normalize some common aliases
     if prefix == "sector" and val.lower() in {"technology", "it"}:
         val = "Information Technology"
-    cols = {}
-    hit = False
-    for item in vocab:
-        col = f"{prefix}_{_slug(item)}"
-        is_one = (val == item)
-        cols[col] = 1 if is_one else 0
-        hit = hit or is_one
-    cols[f"{prefix}_other"] = 0 if hit else 1
+    return index.get(val, len(index))
+
+def _encode_one_hot(value: str | None, columns: tuple[str, ...], index: dict[str, int], prefix: str) -> dict[str, int]:
+    cols = dict.fromkeys(columns, 0)
+    cols[columns[_one_hot_position(value, index, prefix)]] = 1
     return cols
 
+def _encode_one_hot_array(values, index: dict[str, int], width: int, prefix: str) -> np.ndarray:
+    positions = [_one_hot_position(v, index, prefix) for v in values]
+    out = np.zeros((len(positions), width), dtype=np.int8)
+    out[np.arange(len(positions)), positions] = 1
+    return out
+
 def encode_sector(sector: str | None) -> dict[str, int]:
-    return _encode_one_hot(sector, ALL_SECTORS, "sector")
+    return _encode_one_hot(sector, SECTOR_COLUMNS, _SECTOR_INDEX, "sector")
 
 def encode_country(country: str | None) -> dict[str, int]:
-    return _encode_one_hot(country, ALL_COUNTRIES, "country")
+    return _encode_one_hot(country, COUNTRY_COLUMNS, _COUNTRY_INDEX, "country")
+
+def encode_sectors(sectors) -> np.ndarray:
+    """int8 one-hot matrix (len(sectors) x len(SECTOR_COLUMNS))."""
+    return _encode_one_hot_array(sectors, _SECTOR_INDEX, len(SECTOR_COLUMNS), "sector")
+
+def encode_countries(countries) -> np.ndarray:
+    """int8 one-hot matrix (len(countries) x len(COUNTRY_COLUMNS))."""
+    return _encode_one_hot_array(countries, _COUNTRY_INDEX, len(COUNTRY_COLUMNS), "country")
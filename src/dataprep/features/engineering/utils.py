@@ -1,21 +1,50 @@
 import polars as pl
 import datetime
 import logging
+import weakref
+
+# Parsed copies of string-dated frames, keyed by id() of the input frame.
+# A finalizer drops the entry when the input is garbage collected.
+_DATE_CACHE: dict[tuple[int, str], pl.DataFrame] = {}
 
 
 def ensure_date_column(df: pl.DataFrame, column_name: str = "date") -> pl.DataFrame:
-    if df[column_name].dtype != pl.Date:
-        return df.with_columns(
-            pl.col(column_name).str.strptime(pl.Date, "%Y-%m-%d")
-        )
-    return df
+    # schema lookup avoids materializing the column just to read its dtype
+    if df.schema.get(column_name) == pl.Date:
+        return df
+
+    key = (id(df), column_name)
+    cached = _DATE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # Fixed-format to_date is Polars' fastest ISO path; its unique-value cache only costs
+    # time here because date columns hold one distinct value per row
+    parsed = df.with_columns(pl.col(column_name).str.to_date("%Y-%m-%d", strict=True, exact=True, cache=False))
+    _DATE_CACHE[key] = parsed
+    weakref.finalize(df, _DATE_CACHE.pop, key, None)
+    return parsed
 
 
 def find_nearest_price(df: pl.DataFrame, target_date: datetime.date) -> float:
-    filtered = df.filter(pl.col("date") <= target_date)
-    if filtered.is_empty():
+    # Binary search on the date column instead of filtering the whole frame
+    if not df["date"].is_sorted():
+        df = df.sort("date")
+    idx = df["date"].search_sorted(target_date, side="right") - 1
+    if idx < 0:
         raise ValueError(f"No price data available on or before {target_date}")
-    return filtered[-1, "close"]
+    return df[idx, "close"]
+
+
+def find_nearest_prices(df: pl.DataFrame, target_dates: list[datetime.date]) -> list[float]:
+    # Batched find_nearest_price: one search_sorted over all target dates
+    if not df["date"].is_sorted():
+        df = df.sort("date")
+    idx = df["date"].search_sorted(pl.Series(target_dates, dtype=pl.Date), side="right").cast(pl.Int64) - 1
+    if (idx < 0).any():
+        missing = target_dates[int((idx < 0).arg_true()[0])]
+        raise ValueError(f"No price data available on or before {missing}")
+    return df["close"].gather(idx).to_list()
 
 
 def adjust_series_for_splits(
@@ -45,28 +74,17 @@ def adjust_series_for_splits(
             logging.warning("[Splits] No split history available — skipping adjustment.")
         return df
 
-    # Step 1: Sort and compute cumulative ratio
-    split_df = (
-        split_df
-        .sort("date")
-        .with_columns([
-            pl.col("split_ratio").cum_prod().alias("cumulative_ratio"),
-            pl.col("date").alias("split_date")
-        ])
+    # Step 1: Sort and compute cumulative ratio (only the two columns the join needs)
+    split_df = split_df.sort("date").select(
+        pl.col("date").alias("split_date"),
+        pl.col("split_ratio").cum_prod().alias("cumulative_ratio"),
     )
 
     # Step 2: Join split info to main df using backward join
     df = df.sort("date")
     df = df.join_asof(split_df, left_on="date", right_on="split_date", strategy="backward") # "backward" since we dont have enough data
 
-    # Step 3: Fill nulls and compute adjusted values safely
-    df = df.with_columns([
-        pl.col("cumulative_ratio").fill_null(1.0).alias("adj_factor")
-    ])
-    
-    df = df.with_columns([
-        (pl.col(column) / pl.col("adj_factor")).alias(column)
-    ])
-
-    # Step 4: Drop temporary columns
-    return df.drop("split_date", "split_ratio", "cumulative_ratio", "adj_factor")
+    # Step 3: Adjust in a single pass (no split yet -> factor 1.0) and drop temporary columns
+    return df.with_columns(
+        pl.col(column) / pl.col("cumulative_ratio").fill_null(1.0)
+    ).drop("split_date", "cumulative_ratio")
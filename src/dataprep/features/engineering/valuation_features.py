@@ -2,8 +2,6 @@ import polars as pl
 import logging
 
 def extract_latest_pe_pfcf(df: pl.DataFrame) -> tuple[float, float]:
-    df = df.sort("date", descending=True)
-
     if df.is_empty():
         logging.warning("[P/E] No ratio data available at all.")
         return 0.0, 0.0
@@ -14,17 +12,27 @@ def extract_latest_pe_pfcf(df: pl.DataFrame) -> tuple[float, float]:
         logging.warning(f"[P/E] Missing columns in ratio data: {missing}")
         return 0.0, 0.0
 
-    valid = df.filter(
-        (pl.col("priceEarningsRatio") > 0) &
-        (pl.col("priceToFreeCashFlowsRatio") > 0)
-    )
+    pe = pl.col("priceEarningsRatio")
+    pfcf = pl.col("priceToFreeCashFlowsRatio")
+
+    # Row index of the latest date (overall, and among rows where both ratios are positive);
+    # an O(n) arg_max instead of sorting the whole frame
+    latest = pl.col("date").arg_max()
+    latest_valid = pl.when((pe > 0) & (pfcf > 0)).then(pl.col("date")).arg_max()
+
+    row = df.select(
+        latest_valid.alias("valid_idx"),
+        pe.gather(latest_valid).alias("pe"),
+        pfcf.gather(latest_valid).alias("pfcf"),
+        pe.gather(latest).alias("latest_pe"),
+        pfcf.gather(latest).alias("latest_pfcf"),
+    ).row(0, named=True)
 
-    if valid.is_empty():
-        pe = df[-1, "priceEarningsRatio"] if "priceEarningsRatio" in df.columns else "N/A"
-        pfcf = df[-1, "priceToFreeCashFlowsRatio"] if "priceToFreeCashFlowsRatio" in df.columns else "N/A"
+    if row["valid_idx"] is None:
         logging.warning(
-            f"[P/E] No valid non-zero ratio found. Latest values were: P/E={pe}, P/FCF={pfcf}."
+            f"[P/E] No valid non-zero ratio found. "
+            f"Latest values were: P/E={row['latest_pe']}, P/FCF={row['latest_pfcf']}."
         )
         return 0.0, 0.0
 
-    return valid[0, "priceEarningsRatio"], valid[0, "priceToFreeCashFlowsRatio"]
+    return row["pe"], row["pfcf"]
@@ -1,10 +1,32 @@
-from src.dataprep.fetcher.ticker_params.dividends import fetch_dividends
-from src.dataprep.fetcher.ticker_params.prices import fetch_prices
-from src.dataprep.fetcher.ticker_params.ratios import fetch_ratios
-from src.dataprep.fetcher.ticker_params.company import fetch_company_profile
-from src.dataprep.fetcher.ticker_params.fundamentals import (
-    fetch_balance_sheet_fund,
-    fetch_cashflow_statement_fund,
-    fetch_income_statement_fund
-    )
-from src.dataprep.fetcher._fmp_client import fmp_get
\ No newline at end of file
+# Public fetchers are resolved lazily (PEP 562) so importing a light submodule such as
+# fetcher.utils does not pull in polars/yfinance or build the FMP client.
+import importlib
+
+_LAZY = {
+    "fetch_dividends": "src.dataprep.fetcher.ticker_params.dividends",
+    "fetch_dividends_many": "src.dataprep.fetcher.ticker_params.dividends",
+    "fetch_prices": "src.dataprep.fetcher.ticker_params.prices",
+    "fetch_prices_batch": "src.dataprep.fetcher.ticker_params.prices",
+    "fetch_ratios": "src.dataprep.fetcher.ticker_params.ratios",
+    "fetch_ratios_many": "src.dataprep.fetcher.ticker_params.ratios",
+    "fetch_company_profile": "src.dataprep.fetcher.ticker_params.company",
+    "fetch_balance_sheet_fund": "src.dataprep.fetcher.ticker_params.fundamentals",
+    "fetch_cashflow_statement_fund": "src.dataprep.fetcher.ticker_params.fundamentals",
+    "fetch_income_statement_fund": "src.dataprep.fetcher.ticker_params.fundamentals",
+    "fmp_get": "src.dataprep.fetcher._fmp_client",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
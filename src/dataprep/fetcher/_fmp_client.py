@@ -1,19 +1,57 @@
-import os, time, requests
+import os, random, time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import orjson
+from dotenv import load_dotenv
+
+from src.dataprep.fetcher import _http_cache
+from src.dataprep.fetcher.utils import fmp_session
 
 class FMPAuthError(RuntimeError): pass        # 401 invalid/missing key
 class FMPPlanError(RuntimeError): pass        # 403/402 feature not in plan
 class FMPRateLimitError(RuntimeError): pass   # 429 too many requests
 class FMPServerError(RuntimeError): pass      # 5xx
 
+if not os.getenv("FMP_API_KEY"):
+    load_dotenv()
 _API_KEY = os.getenv("FMP_API_KEY")
 if not _API_KEY:
     raise FMPAuthError("FMP_API_KEY not set")
 
-_s = requests.Session()
+_s = fmp_session()
+
+_MAX_RETRY_AFTER_S = 60.0  # a bogus/hostile hint must not park a pool worker for hours
+
+def _retry_after_seconds(value) -> float | None:
+    # Retry-After is either delta-seconds or an HTTP-date
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:  # "-0000" dates parse naive; HTTP-dates are always GMT
+        when = when.replace(tzinfo=timezone.utc)
+    return (when - datetime.now(timezone.utc)).total_seconds()
+
+def _retry_delay(r, backoff: float) -> float:
+    # Honor the server's Retry-After hint (clamped); otherwise jittered exponential backoff
+    hint = _retry_after_seconds(r.headers.get("Retry-After"))
+    if hint is None:
+        return backoff + random.uniform(0, 0.5)
+    return min(max(1.0, hint), _MAX_RETRY_AFTER_S)
 
 def fmp_get(path: str, params=None, max_retries=3):
     url = f"https://financialmodelingprep.com{path}"
     params = dict(params or {})
+    cached = _http_cache.get(url, params)
+    if cached is not _http_cache.MISS:
+        return cached
     params["apikey"] = _API_KEY
 
     backoff = 1.0
@@ -26,10 +64,12 @@ def fmp_get(path: str, params=None, max_retries=3):
         if r.status_code == 429:
             if attempt == max_retries:
                 raise FMPRateLimitError("429 rate limit after retries")
-            time.sleep(backoff); backoff *= 2; continue
+            time.sleep(_retry_delay(r, backoff)); backoff *= 2; continue
         if 500 <= r.status_code < 600:
             if attempt == max_retries:
                 raise FMPServerError(f"{r.status_code} server error")
-            time.sleep(backoff); backoff *= 2; continue
+            time.sleep(_retry_delay(r, backoff)); backoff *= 2; continue
         r.raise_for_status()
-        return r.json()
+        payload = orjson.loads(r.content)
+        _http_cache.put(url, params, payload)
+        return payload
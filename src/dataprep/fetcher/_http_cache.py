@@ -0,0 +1,109 @@
+# dvmax/src/dataprep/fetcher/_http_cache.py
+"""
+Opt-in on-disk cache for FMP JSON responses.
+
+Enabled by pointing FMP_CACHE_PATH at a sqlite file. Entries are keyed by
+sha256(url + sorted params, minus the api key). Requests whose "to" date is
+already in the past never change, so they are kept forever; everything else
+expires after a per-endpoint TTL (a day by default).
+"""
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+import orjson
+
+_LIVE_TTL_S = 24 * 3600
+# endpoint prefix -> TTL in seconds; first match wins
+_TTL_BY_PREFIX = (
+    ("historical-price-full/stock_dividend/", 6 * 3600),  # new declarations land intraday
+    ("quote", 60),
+    ("quota", 30),
+)
+MISS = object()
+
+
+def _cache_path() -> Optional[str]:
+    return os.getenv("FMP_CACHE_PATH") or None
+
+
+# sqlite connections can't be shared across threads; keep one per (thread, path)
+_local = threading.local()
+
+
+@lru_cache(maxsize=None)
+def _init_schema(path: str) -> None:
+    conn = sqlite3.connect(path, timeout=30)
+    try:
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, body BLOB NOT NULL)"
+            )
+    finally:
+        conn.close()
+
+
+def _connection(path: str) -> sqlite3.Connection:
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(path)
+    if conn is None:
+        _init_schema(path)
+        conn = conns[path] = sqlite3.connect(path, timeout=30)
+    return conn
+
+
+def _execute(path: str, sql: str, args: tuple):
+    conn = _connection(path)
+    with conn:  # one transaction per statement, as before
+        return conn.execute(sql, args).fetchone()
+
+
+def cache_key(url: str, params: Optional[dict]) -> str:
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if k != "apikey")
+    return hashlib.sha256(json.dumps([url, items]).encode()).hexdigest()
+
+
+def _ttl(url: str, params: Optional[dict]) -> Optional[float]:
+    to = (params or {}).get("to")
+    try:
+        if to and datetime.date.fromisoformat(str(to)) < datetime.date.today():
+            return None  # closed historical range
+    except ValueError:
+        pass
+    endpoint = url.split("/api/v3/", 1)[-1]
+    for prefix, ttl in _TTL_BY_PREFIX:
+        if endpoint.startswith(prefix):
+            return ttl
+    return _LIVE_TTL_S
+
+
+def get(url: str, params: Optional[dict]) -> Any:
+    """Cached payload, or `MISS`."""
+    path = _cache_path()
+    if not path:
+        return MISS
+    row = _execute(path, "SELECT expires, body FROM responses WHERE key = ?", (cache_key(url, params),))
+    if row is None or (row[0] is not None and row[0] < time.time()):
+        return MISS
+    return orjson.loads(row[1])
+
+
+def put(url: str, params: Optional[dict], payload: Any) -> None:
+    path = _cache_path()
+    if not path:
+        return
+    ttl = _ttl(url, params)
+    expires = None if ttl is None else time.time() + ttl
+    _execute(
+        path,
+        "INSERT OR REPLACE INTO responses (key, expires, body) VALUES (?, ?, ?)",
+        (cache_key(url, params), expires, orjson.dumps(payload)),
+    )
@@ -1,11 +1,41 @@
 # dvmax/src/dataprep/fetcher/base.py
 import os
+import random
 import time
-import json
 import logging
-from typing import Any, Dict, Optional
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
 
+import orjson
 import requests
+from dotenv import load_dotenv
+
+from src.dataprep.fetcher import _http_cache
+from src.dataprep.fetcher.utils import fmp_session
+
+# Read .env once per process (not per client), and only when the key isn't already set
+if not os.getenv("FMP_API_KEY"):
+    load_dotenv()
+
+# Per-caller request tally (see count_requests); request_count stays the process-wide total
+_request_tally: ContextVar[Optional[list]] = ContextVar("fmp_request_tally", default=None)
+
+
+@contextmanager
+def count_requests() -> Iterator[list]:
+    """
+    Count FMP requests made in this context: `with count_requests() as tally: ...; tally[0]`.
+    Worker threads only see it if their task runs in a copy of this context (contextvars.copy_context).
+    """
+    tally = [0]
+    token = _request_tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _request_tally.reset(token)
+
 
 # Typed errors so your runners / workflow can branch on cause
 class FMPAuthError(RuntimeError): pass        # 401 bad/missing key
@@ -22,23 +52,21 @@ class FMPClient:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.request_count = 0
+        self._count_lock = threading.Lock()  # fetchers may run on a thread pool
 
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "dvmax/feature-fetcher"})
+        self.session = fmp_session()
 
     def _sleep_backoff(self, attempt: int, retry_after: Optional[str]) -> None:
         if retry_after:
             try:
-                # Honor server hint first
+                # Honor server hint first; a little jitter so retriers don't all wake together
                 sleep_s = int(retry_after)
-                time.sleep(max(1, sleep_s))
+                time.sleep(max(1, sleep_s) + random.uniform(0, 1))
                 return
             except Exception:
                 pass
-        # Exponential backoff with jitter
-        base = 1.5 ** attempt
-        jitter = 0.25 + (time.time() % 0.5)  # small pseudo-jitter
-        time.sleep(min(30, base + jitter))
+        # "Full jitter" exponential backoff: uniform over [0, min(cap, 0.5 * 2^attempt)]
+        time.sleep(random.uniform(0, min(30, 0.5 * 2 ** attempt)))
 
     def fetch(self, endpoint: str, params: Optional[Dict[str, Any]] = None, max_retries: int = 3) -> Any:
         if endpoint.startswith("/"):
@@ -46,6 +74,9 @@ class FMPClient:
         url = f"{self.base_url}/{endpoint}"
 
         params = dict(params or {})
+        cached = _http_cache.get(url, params)
+        if cached is not _http_cache.MISS:
+            return cached
         params["apikey"] = self.api_key
 
         last_exc = None
@@ -69,16 +100,19 @@ class FMPClient:
             # Classify status codes early
             code = resp.status_code
             if code == 200:
-                self.request_count += 1
-                # FMP sometimes returns [] or {} — both valid
-                ctype = resp.headers.get("Content-Type", "")
-                if "application/json" in ctype or resp.text.strip().startswith(("{", "[")):
-                    return resp.json()
-                # Fallback parse
+                tally = _request_tally.get()
+                with self._count_lock:
+                    self.request_count += 1
+                    if tally is not None:
+                        tally[0] += 1
+                # FMP sometimes returns [] or {} — both valid.
+                # Parse the raw bytes once with orjson; only non-JSON bodies fall back to text.
                 try:
-                    return resp.json()
-                except json.JSONDecodeError:
+                    payload = orjson.loads(resp.content)
+                except orjson.JSONDecodeError:
                     return resp.text
+                _http_cache.put(url, params, payload)
+                return payload
 
             if code == 401:
                 raise FMPAuthError("401 Unauthorized: bad/missing API key")
@@ -112,3 +146,27 @@ class FMPClient:
                 body = resp.text
             resp.raise_for_status()  # will raise HTTPError including code
             return body  # Unreachable, but keeps type checkers happy
+
+    def fetch_many(
+        self,
+        endpoint: str,
+        tickers: list[str],
+        params: Optional[Dict[str, Any]] = None,
+        batch_size: int = 20,
+        max_retries: int = 3,
+    ) -> Dict[str, list]:
+        """
+        Fetch a multi-symbol endpoint (e.g. "profile", "quote") for many tickers with
+        one request per `batch_size` symbols, and split the rows back out by "symbol".
+        """
+        endpoint = endpoint.strip("/")
+        out: Dict[str, list] = {t: [] for t in tickers}
+        symbols = list(out)
+        for i in range(0, len(symbols), batch_size):
+            chunk = symbols[i:i + batch_size]
+            data = self.fetch(f"{endpoint}/{','.join(chunk)}", params, max_retries)
+            for row in data if isinstance(data, list) else []:
+                rows = out.get(row.get("symbol"))
+                if rows is not None:
+                    rows.append(row)
+        return out
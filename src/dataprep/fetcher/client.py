@@ -1,3 +1,5 @@
 from src.dataprep.fetcher.base import FMPClient
 
+# Process-wide client. Fetchers must import this rather than build their own FMPClient,
+# so the connection pool (fmp_session), the response cache and request_count are shared.
 fmp_client = FMPClient()
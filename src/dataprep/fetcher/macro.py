@@ -1,42 +1,79 @@
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+import orjson
 import pandas as pd
 
+from src.dataprep.fetcher.utils import pooled_session
+
+BASE_URL = "https://api.worldbank.org/v2"
+
+
+@lru_cache(maxsize=1)
+def _country_code_map(timeout: int = 30) -> dict:
+    """Country name -> World Bank code. Static, so fetched once per process for all instances."""
+    with pooled_session() as session:
+        resp = session.get(f"{BASE_URL}/country", params={"format": "json", "per_page": 500}, timeout=timeout)
+        resp.raise_for_status()
+        countries = orjson.loads(resp.content)[1]
+    return {c["name"]: c["id"] for c in countries}
+
+
 class WorldBankAPI:
-    BASE_URL = "https://api.worldbank.org/v2"
+    BASE_URL = BASE_URL
 
-    def __init__(self):
+    def __init__(self, timeout: int = 30):
+        self.session = pooled_session()
+        self.timeout = timeout
         self._country_code_map = self._load_country_code_map()
 
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def _load_country_code_map(self):
-        url = f"{self.BASE_URL}/country"
-        params = {"format": "json", "per_page": 500}
-        resp = requests.get(url, params=params)
-        resp.raise_for_status()
-        countries = resp.json()[1]
-        return {c["name"]: c["id"] for c in countries}
+        return _country_code_map(self.timeout)
 
     def get_country_code(self, name):
         return self._country_code_map.get(name)
 
-    def fetch_macro_indicators(self, indicator_map, country_name, start=1990, end=2023):
+    def _fetch_indicator(self, code, indicator_code, start, end):
+        url = f"{self.BASE_URL}/country/{code}/indicator/{indicator_code}"
+        params = {"format": "json", "date": f"{start}:{end}", "per_page": 1000}
+        resp = self.session.get(url, params=params, timeout=self.timeout)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)[1]
+
+    def fetch_macro_indicators(self, indicator_map, country_name, start=1990, end=2023, max_workers=8):
         code = self.get_country_code(country_name)
         if not code:
             raise ValueError(f"❌ Country not found: {country_name}")
 
-        dfs = []
-        for indicator_code, name in indicator_map.items():
-            url = f"{self.BASE_URL}/country/{code}/indicator/{indicator_code}"
-            params = {"format": "json", "date": f"{start}:{end}", "per_page": 1000}
-            resp = requests.get(url, params=params)
-            resp.raise_for_status()
-            records = resp.json()[1]
-            df = pd.DataFrame([
-                {"date": int(r["date"]), name: r["value"]}
-                for r in records if r["value"] is not None
-            ])
-            df["date"] = pd.to_datetime(df["date"], format="%Y")
-            df.set_index("date", inplace=True)
-            dfs.append(df)
-
-        result = pd.concat(dfs, axis=1).sort_index()
-        return result
+        # one request per indicator; they are independent, so download them concurrently
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            responses = list(pool.map(
+                lambda indicator_code: self._fetch_indicator(code, indicator_code, start, end),
+                indicator_map,
+            ))
+
+        # fill one preallocated column per indicator, then build the frame once.
+        # World Bank dates are year strings: map them to row positions with a lookup table
+        years = np.arange(str(start), str(end + 1), dtype="datetime64[Y]")
+        row_of = {str(year): i for i, year in enumerate(range(start, end + 1))}
+        cols = {name: np.full(len(years), np.nan) for name in indicator_map.values()}
+        for name, records in zip(indicator_map.values(), responses):
+            col = cols[name]
+            for r in records or ():
+                i = row_of.get(r["date"])
+                if i is not None and r["value"] is not None:
+                    col[i] = r["value"]
+
+        index = pd.DatetimeIndex(years.astype("datetime64[ns]"), name="date")
+        # keep only years that some indicator reported, as the old outer concat did
+        return pd.DataFrame(cols, index=index).dropna(how="all")
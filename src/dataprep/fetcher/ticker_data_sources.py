@@ -1,28 +1,75 @@
 from src.dataprep.fetcher.ticker_params.prices import fetch_prices
 from src.dataprep.fetcher.ticker_params.dividends import fetch_dividends
+# splits go through the dividends module's process/disk cache (and warm_splits_cache)
+from src.dataprep.fetcher.ticker_params.dividends import cached_splits
 from src.dataprep.fetcher.ticker_params.ratios import fetch_ratios
 from src.dataprep.fetcher.ticker_params.fundamentals import fetch_balance_sheet_fund, fetch_income_statement_fund
 from src.dataprep.fetcher.ticker_params.company import fetch_company_profile
-from src.dataprep.fetcher.ticker_params.splits import fetch_splits
 from src.dataprep.fetcher.ticker_params.sector import fetch_sector_index
-from src.dataprep.fetcher.client import fmp_client
+from src.dataprep.fetcher.base import count_requests
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 
-def fetch_all_per_ticker(ticker: str, div_lookback_years: int, other_lookback_years: int) -> dict:
-    fmp_client.request_count = 0
+def _submit(pool: ThreadPoolExecutor, fn, *args, **kwargs):
+    # run in a copy of the caller's context so count_requests() sees the worker's requests
+    return pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
 
-    profile = fetch_company_profile(ticker)
-    result = {
-        "prices": fetch_prices(ticker, lookback_years=div_lookback_years),
-        "dividends": fetch_dividends(ticker, lookback_years=div_lookback_years),
-        "ratios": fetch_ratios(ticker, limit=other_lookback_years),
-        "balance": fetch_balance_sheet_fund(ticker, limit=other_lookback_years),
-        "income": fetch_income_statement_fund(ticker, limit=other_lookback_years),
-        "profile": profile,
-        "splits": fetch_splits(ticker),
-        "sector_index": fetch_sector_index(ticker, limit=other_lookback_years, profile=profile)
-    }
 
-    logging.info(f"🔍 Total FMP API requests for ticker {ticker}: {fmp_client.request_count}")
+def fetch_all_per_ticker(
+    ticker: str,
+    div_lookback_years: int,
+    other_lookback_years: int,
+    max_workers: int = 8
+) -> dict:
+    """
+    Fetch every per-ticker input. The sources are independent network calls and run
+    concurrently on a thread pool; sector_index waits for the profile and dividends
+    reuse the splits fetch instead of downloading them again.
+    """
+    with count_requests() as tally, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        profile_future = _submit(pool, fetch_company_profile, ticker)
+        # submitted ahead of dividends, so it is never queued behind the task waiting on it
+        splits_future = _submit(pool, cached_splits, ticker)
+        futures = {
+            "prices": _submit(pool, fetch_prices, ticker, lookback_years=div_lookback_years),
+            "dividends": _submit(
+                pool, lambda: fetch_dividends(ticker, lookback_years=div_lookback_years, splits_df=splits_future.result())
+            ),
+            "ratios": _submit(pool, fetch_ratios, ticker, limit=other_lookback_years),
+            "balance": _submit(pool, fetch_balance_sheet_fund, ticker, limit=other_lookback_years),
+            "income": _submit(pool, fetch_income_statement_fund, ticker, limit=other_lookback_years),
+            "splits": splits_future,
+        }
+        profile = profile_future.result()
+        futures["sector_index"] = _submit(
+            pool, fetch_sector_index, ticker, limit=other_lookback_years, profile=profile
+        )
+        result = {key: fut.result() for key, fut in futures.items()}
+    result["profile"] = profile
+
+    logging.info(f"🔍 Total FMP API requests for ticker {ticker}: {tally[0]}")
     return result
+
+
+def fetch_all_batch(
+    tickers: list[str],
+    div_lookback_years: int,
+    other_lookback_years: int,
+    max_concurrency: int = 4
+) -> dict[str, dict]:
+    """
+    fetch_all_per_ticker over many tickers, at most `max_concurrency` tickers in flight
+    (tune to the FMP plan's rate limit). Tickers that fail are logged and left out.
+    """
+    def _one(ticker: str):
+        try:
+            return fetch_all_per_ticker(ticker, div_lookback_years, other_lookback_years)
+        except Exception as e:
+            logging.warning(f"[fetch_all_batch] {ticker}: {type(e).__name__}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        results = dict(zip(tickers, pool.map(_one, tickers)))
+    return {ticker: inputs for ticker, inputs in results.items() if inputs is not None}
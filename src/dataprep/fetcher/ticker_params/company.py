@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Literal
 import yfinance as yf
 import polars as pl
@@ -5,18 +6,25 @@ from src.dataprep.constants import SECTOR_NORMALIZATION, SECTOR_TO_ETF
 from src.dataprep.fetcher.client import fmp_client
 
 def fetch_company_profile(ticker: str, mode: Literal["auto", "fmp", "yfinance"] = "auto") -> dict:
+    # Profiles (sector, country, ...) are effectively static: download each once per process.
+    # Return a copy so callers can't mutate the cached entry.
+    return dict(_cached_company_profile(ticker, mode))
+
+
+@lru_cache(maxsize=4096)
+def _cached_company_profile(ticker: str, mode: str) -> dict:
     if mode == "yfinance":
         info = yf.Ticker(ticker).info
         return info if info else {}
-    
+
     if mode == "fmp":
         data = fmp_client.fetch(f"profile/{ticker}")
         return data[0] if data else {}
 
     # auto fallback mode
-    info = fetch_company_profile(ticker, "yfinance")
+    info = _cached_company_profile(ticker, "yfinance")
     if not info or "sector" not in info:
-        info = fetch_company_profile(ticker, "fmp")
+        info = _cached_company_profile(ticker, "fmp")
     return info
 
 
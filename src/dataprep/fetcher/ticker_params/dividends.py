@@ -1,19 +1,23 @@
+import calendar
 import logging
-from datetime import datetime, date
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from functools import lru_cache
-from dateutil.relativedelta import relativedelta
+from pathlib import Path
 from typing import Literal
 
 import polars as pl
 import yfinance as yf
 
 from src.dataprep.fetcher.ticker_params.splits import fetch_splits
-from src.dataprep.fetcher.utils import default_date_range
+from src.dataprep.fetcher.utils import parsed_date_range, utc_days
 from src.dataprep.fetcher.client import fmp_client
 
-# ---- warn-once registries ----
-_warned_no_dividends: set[str] = set()
-_warned_no_yield: set[tuple[str, str]] = set()
+_DIVIDENDS_SCHEMA = {"date": pl.Utf8, "dividend": pl.Float64}
+_DISK_CACHE_TTL_S = 24 * 3600
 
 
 def _empty_dividends_df() -> pl.DataFrame:
@@ -24,63 +28,208 @@ def _empty_dividends_df() -> pl.DataFrame:
 
 
 def adjust_dividends_with_splits(div_df: pl.DataFrame, split_df: pl.DataFrame) -> pl.DataFrame:
-    for row in split_df.iter_rows(named=True):
-        split_date, ratio = row["date"], row["split_ratio"]
-        div_df = div_df.with_columns(
-            pl.when(pl.col("date") < split_date)
-              .then(pl.col("dividend") / ratio)
-              .otherwise(pl.col("dividend"))
-              .alias("dividend")
-        )
-    return div_df
+    """Divide each dividend by the product of all split ratios dated after it."""
+    if split_df.is_empty() or div_df.is_empty():
+        return div_df
+    # only splits after the first dividend, with a ratio other than 1, change anything
+    splits = (
+        split_df.lazy()
+        .select("date", pl.col("split_ratio").cast(pl.Float64))
+        .filter((pl.col("date") > div_df["date"].min()) & (pl.col("split_ratio") != 1.0))
+        .sort("date")
+        .collect()
+    )
+    if splits.is_empty():
+        return div_df
+    # factors[i] = product of ratios of splits i..n-1; trailing 1.0 for dividends after the last split
+    factors = (
+        splits["split_ratio"].reverse().cum_prod().reverse()
+        .append(pl.Series([1.0]))
+    )
+    # index of the first split strictly after each dividend date (keeps div_df row order)
+    idx = splits["date"].search_sorted(div_df["date"], side="right")
+    return div_df.with_columns(pl.col("dividend") / factors.gather(idx))
 
 
-def _warn_once(key: str, message: str):
-    if key not in _warned_no_dividends:
-        logging.warning(message)
-        _warned_no_dividends.add(key)
+# bounded, so a long-lived process doesn't accumulate one entry per ticker forever;
+# a key evicted from the LRU may warn again, which is harmless
+@lru_cache(maxsize=8192)
+def _warn_once(key: str, message: str) -> None:
+    logging.warning(message)
 
 
 # ---------- CACHES ----------
+# Two levels: lru_cache within the process, plus opt-in parquet files (DIVIDENDS_CACHE_DIR)
+# shared across runs and processes. Entries older than a day are refetched.
+
+def _cache_dir() -> Path | None:
+    path = os.getenv("DIVIDENDS_CACHE_DIR")
+    return Path(path) if path else None
+
+
+def _load_cache(key: str) -> pl.DataFrame | None:
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    path = cache_dir / f"{key}.parquet"
+    try:
+        if time.time() - path.stat().st_mtime >= _DISK_CACHE_TTL_S:
+            return None
+        df = pl.read_parquet(path)
+    except OSError:
+        return None
+    except pl.exceptions.PolarsError as e:
+        # truncated/corrupt file: drop it so this and later runs refetch instead of failing
+        logging.warning(f"[dividends cache] unreadable {path.name}, refetching: {type(e).__name__}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+    # frames are written sorted by date; parquet doesn't keep the flag
+    return df.set_sorted("date") if "date" in df.columns else df
+
+
+def _save_cache(key: str, df: pl.DataFrame) -> None:
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"{key}.parquet"
+    # per process *and* thread: the warmers save from thread pools
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    df.write_parquet(tmp, compression="zstd")
+    os.replace(tmp, path)  # atomic, so concurrent readers never see a partial file
+
+
+def _disk_cached(key: str, fetch) -> pl.DataFrame:
+    df = _load_cache(key)
+    if df is None:
+        df = fetch()
+        _save_cache(key, df)
+    return df
+
 
 @lru_cache(maxsize=4096)
 def _cached_splits(ticker: str, mode: str = "yfinance") -> pl.DataFrame:
-    return fetch_splits(ticker, mode=mode)
+    return _disk_cached(f"splits_{mode}_{ticker}", lambda: fetch_splits(ticker, mode=mode))
+
+def cached_splits(ticker: str, mode: Literal["yfinance", "fmp"] = "yfinance") -> pl.DataFrame:
+    """fetch_splits through the same process/disk caches fetch_dividends uses."""
+    return _cached_splits(ticker, mode)
 
 @lru_cache(maxsize=4096)
 def _cached_dividends_yf_full(ticker: str) -> pl.DataFrame:
-    """Fetch full YF dividends once; empty frame if none."""
+    """Full YF dividend history, fetched once per day; empty frame if none."""
+    return _disk_cached(f"divs_yf_{ticker}", lambda: _fetch_dividends_yf_full(ticker))
+
+@lru_cache(maxsize=4096)
+def _cached_dividends_fmp_full(ticker: str) -> pl.DataFrame:
+    """Full FMP dividend history, fetched once per day; empty frame if none."""
+    return _disk_cached(f"divs_fmp_{ticker}", lambda: _fetch_dividends_fmp_full(ticker))
+
+
+def _warm(cached_fetch, tickers, max_workers: int, label: str, min_interval: float = 0.0) -> None:
+    # min_interval spaces out task starts (not completions), so callers keep their request rate
+    start_lock = threading.Lock()
+    next_start = time.monotonic()
+
+    def _one(ticker: str) -> None:
+        nonlocal next_start
+        if min_interval > 0:
+            with start_lock:
+                time.sleep(max(next_start - time.monotonic(), 0.0))
+                next_start = time.monotonic() + min_interval
+        try:
+            cached_fetch(ticker)
+        except Exception as e:
+            logging.warning(f"[{label}] {ticker}: {type(e).__name__}: {e}")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(_one, dict.fromkeys(tickers)))
+
+
+def warm_splits_cache(
+    tickers, mode: Literal["yfinance", "fmp"] = "yfinance", max_workers: int = 8, min_interval: float = 0.0
+) -> None:
+    """Prefetch splits for many tickers concurrently into the caches behind cached_splits."""
+    _warm(lambda ticker: _cached_splits(ticker, mode), tickers, max_workers, "warm_splits_cache", min_interval)
+
+
+def warm_dividends_cache(
+    tickers, mode: Literal["fmp", "yfinance"] = "yfinance", max_workers: int = 8, min_interval: float = 0.0
+) -> None:
+    """
+    Download full dividend histories for many tickers concurrently, so the per-ticker
+    fetch_dividends calls that follow are served from the caches. Failures are only logged;
+    fetch_dividends will retry (and raise) for those tickers as usual.
+    `min_interval` is the minimum number of seconds between two ticker downloads starting.
+    """
+    cached_full = _cached_dividends_yf_full if mode == "yfinance" else _cached_dividends_fmp_full
+    _warm(cached_full, tickers, max_workers, "warm_dividends_cache", min_interval)
+
+
+def warm_ticker_caches(
+    tickers, mode: Literal["fmp", "yfinance"] = "yfinance", max_workers: int = 8, min_interval: float = 0.0
+) -> None:
+    """
+    warm_dividends_cache and warm_splits_cache in a single pass: one task per ticker
+    fetches its dividend history and then its splits (the yfinance splits fetch_dividends uses).
+    """
+    cached_full = _cached_dividends_yf_full if mode == "yfinance" else _cached_dividends_fmp_full
+
+    def _both(ticker: str) -> None:
+        cached_full(ticker)
+        _cached_splits(ticker, "yfinance")
+
+    _warm(_both, tickers, max_workers, "warm_ticker_caches", min_interval)
+
+
+def _fetch_dividends_yf_full(ticker: str) -> pl.DataFrame:
     yf_tkr = yf.Ticker(ticker)
     dividends = yf_tkr.dividends
     if dividends.empty:
         return _empty_dividends_df()
+    # UTC day as datetime64[D] maps straight onto pl.Date: no Python objects, no cast pass
     return pl.DataFrame({
-        "date": dividends.index,
-        "dividend": dividends.values
-    }).with_columns(pl.col("date").cast(pl.Date))
+        "date": utc_days(dividends.index),
+        "dividend": dividends.to_numpy(dtype="float64"),
+    }).sort("date")
 
-@lru_cache(maxsize=4096)
-def _cached_dividends_fmp_full(ticker: str) -> pl.DataFrame:
-    """Fetch a very wide window from FMP once; empty frame if none."""
+def _fetch_dividends_fmp_full(ticker: str) -> pl.DataFrame:
     # wide window once; slice later
     resp = fmp_client.fetch(
         f"historical-price-full/stock_dividend/{ticker}",
-        {"from": "1980-01-01", "to": datetime.today().strftime("%Y-%m-%d")}
+        {"from": "1980-01-01", "to": date.today().isoformat()}
     )
     data = resp.get("historical", [])
     if not data:
         return _empty_dividends_df()
     return (
-        pl.DataFrame(data)
-        .select(["date", "dividend"])
-        .with_columns(pl.col("date").str.strptime(pl.Date, "%Y-%m-%d"))
+        pl.from_dicts(data, schema=_DIVIDENDS_SCHEMA)
+        .with_columns(pl.col("date").str.to_date("%Y-%m-%d", strict=True, exact=True, cache=False))
+        .sort("date")  # FMP is newest-first; ascending + sorted flag for slicing/joins downstream
     )
 
 
+def _shift_months(d: date, months: int) -> date:
+    """d moved by whole months, day clamped to the target month's length (as relativedelta does)."""
+    m = d.month - 1 + months
+    year, month = d.year + m // 12, m % 12 + 1
+    return date(year, month, min(d.day, calendar.monthrange(year, month)[1]))
+
+
+@lru_cache(maxsize=32)
+def _dividend_window(lookback_years, start_date, end_date, grace_quarters: int, _today: date) -> tuple[date, date]:
+    # same arguments for every ticker in a batch; keyed on today so the window rolls over
+    _, _, start_dt, end_dt = parsed_date_range(lookback_years, start_date, end_date, quarter_mode=True)
+    return _shift_months(start_dt, -3 * grace_quarters), _shift_months(end_dt, 3 * grace_quarters)
+
+
 def _slice(df: pl.DataFrame, start: date, end: date) -> pl.DataFrame:
+    """Inclusive [start, end] window of a date-sorted frame (all cached frames are), by binary search."""
     if df.is_empty():
         return df
-    return df.filter((pl.col("date") >= start) & (pl.col("date") <= end))
+    lo = df["date"].search_sorted(start, side="left")
+    hi = df["date"].search_sorted(end, side="right")
+    return df.slice(lo, max(hi - lo, 0))
 
 
 # ---------- PUBLIC API ----------
@@ -92,22 +241,20 @@ def fetch_dividends(
     lookback_years: int | None = None,
     grace_quarters: int = 1,
     mode: Literal["fmp", "yfinance"] = "yfinance",
-    fallback_to_fmp: bool = True
+    fallback_to_fmp: bool = True,
+    splits_df: pl.DataFrame | None = None
 ) -> pl.DataFrame:
     """
     Fetch dividends with caching (full-history once per ticker per source),
     window slicing, warn-once logging, and split adjustment.
+    Pass `splits_df` when the caller already has the ticker's splits; otherwise
+    they are fetched from yfinance.
     """
 
     # 1) Window (+ grace)
-    start_date, end_date = default_date_range(
-        lookback_years, start_date, end_date, quarter_mode=True
+    window_start, window_end = _dividend_window(
+        lookback_years, start_date, end_date, grace_quarters, date.today()
     )
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
-    end_dt   = datetime.strptime(end_date,   "%Y-%m-%d").date()
-    grace    = relativedelta(months=3 * grace_quarters)
-    window_start = start_dt - grace
-    window_end   = end_dt   + grace
 
     # 2) Primary source
     if mode == "yfinance":
@@ -122,7 +269,9 @@ def fetch_dividends(
             else:
                 return _empty_dividends_df()
         df = _slice(df_full, window_start, window_end)
-        splits = _cached_splits(ticker, "yfinance")
+        if df.is_empty():
+            return df  # nothing in the window: don't look up splits at all
+        splits = splits_df if splits_df is not None else _cached_splits(ticker, "yfinance")
         return adjust_dividends_with_splits(df, splits)
 
     if mode == "fmp":
@@ -131,7 +280,32 @@ def fetch_dividends(
             _warn_once(f"fmp:{ticker}", f"No dividend data for {ticker} in FMP.")
             return _empty_dividends_df()
         df = _slice(df_full, window_start, window_end)
-        splits = _cached_splits(ticker, "yfinance")  # splits via YF is fine
+        if df.is_empty():
+            return df
+        splits = splits_df if splits_df is not None else _cached_splits(ticker, "yfinance")  # splits via YF is fine
         return adjust_dividends_with_splits(df, splits)
 
     raise ValueError(f"Unknown mode '{mode}' in fetch_dividends()")
+
+
+def fetch_dividends_many(
+    tickers,
+    mode: Literal["fmp", "yfinance"] = "yfinance",
+    max_workers: int = 8,
+    **kwargs,
+) -> pl.DataFrame:
+    """
+    fetch_dividends for many tickers as one long frame (ticker, date, dividend).
+    Histories and splits are prefetched concurrently; tickers that still fail are logged and left out.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    warm_ticker_caches(tickers, mode=mode, max_workers=max_workers)
+    frames = [_empty_dividends_df().insert_column(0, pl.Series("ticker", [], dtype=pl.Utf8))]
+    for ticker in tickers:
+        try:
+            df = fetch_dividends(ticker, mode=mode, **kwargs)
+        except Exception as e:
+            logging.warning(f"[fetch_dividends_many] {ticker}: {type(e).__name__}: {e}")
+            continue
+        frames.append(df.select(pl.lit(ticker, dtype=pl.Utf8).alias("ticker"), "date", "dividend"))
+    return pl.concat(frames, how="vertical")
@@ -2,7 +2,22 @@ import polars as pl
 from src.dataprep.fetcher.client import fmp_client
 
 
-def _fetch_fundamental(endpoint: str, ticker: str, limit: int, period: str = "annual") -> pl.DataFrame:
+def _numeric_schema(*fields: str) -> dict:
+    # "date" arrives as an ISO string; every statement line item is numeric
+    return {"date": pl.Utf8} | {name: pl.Float64 for name in fields}
+
+
+_INCOME_SCHEMA = _numeric_schema(
+    "incomeBeforeTax", "interestExpense", "eps", "netIncome", "revenue", "operatingIncome", "grossProfitRatio",
+    "ebitdaratio", "operatingIncomeRatio", "netIncomeRatio", "depreciationAndAmortization", "weightedAverageShsOut"
+)
+_BALANCE_SCHEMA = _numeric_schema("cashAndShortTermInvestments", "totalDebt")
+_CASHFLOW_SCHEMA = _numeric_schema("depreciationAndAmortization", "capitalExpenditure")
+
+
+def _fetch_fundamental(
+    endpoint: str, ticker: str, limit: int, period: str = "annual", schema: dict | None = None
+) -> pl.DataFrame:
     """
     Internal utility to fetch financial data (e.g. income statement, balance sheet) from FMP.
 
@@ -11,6 +26,7 @@ def _fetch_fundamental(endpoint: str, ticker: str, limit: int, period: str = "an
         ticker (str): Stock ticker symbol.
         limit (int): Number of most recent records to return (max 4 for free-tier annual data).
         period (str): Either "annual" or "quarter".
+        schema (dict | None): Fields to keep and their dtypes; others are never materialized. None keeps all.
 
     Returns:
         pl.DataFrame: The requested subset of financial data, parsed and sorted.
@@ -25,27 +41,25 @@ def _fetch_fundamental(endpoint: str, ticker: str, limit: int, period: str = "an
     if not data:
         return pl.DataFrame()
 
-    df = pl.DataFrame(data)
-    if df.schema.get("date") == pl.Utf8:
-        df = df.with_columns(pl.col("date").str.strptime(pl.Date, "%Y-%m-%d"))
+    parse_date = pl.col("date").str.to_date("%Y-%m-%d", strict=True, exact=True, cache=False)
+    if schema:
+        # typed schema: "date" is always Utf8, so parse without inspecting the frame
+        df = pl.from_dicts(data, schema=schema).with_columns(parse_date)
+    else:
+        df = pl.DataFrame(data)
+        if df.schema.get("date") == pl.Utf8:
+            df = df.with_columns(parse_date)
 
-    return df.sort("date", descending=True).head(limit).sort("date")
+    return df.top_k(limit, by="date").sort("date")
 
 
 def fetch_income_statement_fund(ticker: str, limit: int, period: str = "annual") -> pl.DataFrame:
-    return _fetch_fundamental("income-statement", ticker, limit, period).select([
-        "date", "incomeBeforeTax", "interestExpense", "eps", "netIncome", "revenue", "operatingIncome", "grossProfitRatio", 
-        "ebitdaratio", "operatingIncomeRatio", "netIncomeRatio", "depreciationAndAmortization", "weightedAverageShsOut"
-    ])
+    return _fetch_fundamental("income-statement", ticker, limit, period, schema=_INCOME_SCHEMA)
 
 
 def fetch_balance_sheet_fund(ticker: str, limit: int, period: str = "annual") -> pl.DataFrame:
-    return _fetch_fundamental("balance-sheet-statement", ticker, limit, period).select([
-        "date", "cashAndShortTermInvestments", "totalDebt"
-    ])
+    return _fetch_fundamental("balance-sheet-statement", ticker, limit, period, schema=_BALANCE_SCHEMA)
 
 
 def fetch_cashflow_statement_fund(ticker: str, limit: int, period: str = "annual") -> pl.DataFrame:
-    return _fetch_fundamental("cash-flow-statement", ticker, limit, period).select([
-        "date", "depreciationAndAmortization", "capitalExpenditure"
-    ])
+    return _fetch_fundamental("cash-flow-statement", ticker, limit, period, schema=_CASHFLOW_SCHEMA)
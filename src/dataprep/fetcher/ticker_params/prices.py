@@ -1,9 +1,12 @@
+import logging
 from typing import Literal
 import polars as pl
-from datetime import datetime, timedelta
+from datetime import timedelta
 import yfinance as yf
 from src.dataprep.fetcher.client import fmp_client
-from src.dataprep.fetcher.utils import default_date_range
+from src.dataprep.fetcher.utils import parsed_date_range, utc_days
+
+_PRICES_SCHEMA = {"date": pl.Utf8, "close": pl.Float64}
 
 def fetch_prices(
     ticker: str,
@@ -13,30 +16,30 @@ def fetch_prices(
     grace_days: int = 7,
     mode: Literal["fmp", "yfinance"] = "yfinance"
 ) -> pl.DataFrame:
-    start_date, end_date = default_date_range(lookback_years, start_date, end_date)
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d").date()
+    start_date, end_date, start_dt, end_dt = parsed_date_range(lookback_years, start_date, end_date)
 
     if mode == "yfinance":
         yf_ticker = yf.Ticker(ticker)
         hist = yf_ticker.history(start=start_date, end=end_date)
         if hist.empty:
             raise RuntimeError(f"No price data from yfinance for {ticker}")
-        df = pl.DataFrame({
-            "date": hist.index.to_list(),
-            "close": hist["Close"].to_list()
-        }).with_columns(pl.col("date").cast(pl.Date))
-        return df
+        # column arrays straight from numpy (UTC day as datetime64[D] -> pl.Date), no Python lists
+        return pl.DataFrame({
+            "date": utc_days(hist.index),
+            "close": hist["Close"].to_numpy(dtype="float64"),
+        }).sort("date")
 
     data = fmp_client.fetch(f"historical-price-full/{ticker}", {"from": start_date, "to": end_date}).get("historical", [])
     if not data:
         raise RuntimeError(f"No price data from FMP for {ticker}")
-    df = pl.DataFrame(data).select(["date", "close"]).with_columns(
-        pl.col("date").str.strptime(pl.Date, "%Y-%m-%d")
-    )
+    # FMP returns newest first; sorting ascending also sets the sorted flag on "date",
+    # so downstream sort/search_sorted/join_asof calls skip their own sort
+    df = pl.from_dicts(data, schema=_PRICES_SCHEMA).with_columns(
+        pl.col("date").str.strptime(pl.Date, "%Y-%m-%d", strict=True, exact=True, cache=False)
+    ).sort("date")
 
-    actual_start = df.select(pl.col("date").min()).item()
-    actual_end = df.select(pl.col("date").max()).item()
+    actual_start = df[0, "date"]
+    actual_end = df[-1, "date"]
 
     if actual_start > start_dt + timedelta(days=grace_days):
         raise RuntimeError(f"Data for {ticker} starts at {actual_start}, which is more than {grace_days} days after requested start {start_date}.")
@@ -44,3 +47,38 @@ def fetch_prices(
         raise RuntimeError(f"Data for {ticker} ends at {actual_end}, too far before requested {end_date}.")
 
     return df
+
+
+def fetch_prices_batch(
+    tickers: list[str],
+    start_date: str | None = None,
+    end_date: str | None = None,
+    lookback_years: int | None = None,
+) -> dict[str, pl.DataFrame]:
+    """
+    yfinance closes for many tickers in one yf.download call (Yahoo requests run on its
+    own thread pool). Returns {ticker: date/close frame}; tickers without data are logged and left out.
+    """
+    start_date, end_date, _, _ = parsed_date_range(lookback_years, start_date, end_date)
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+    # yf.download upper-cases symbols in its columns; results are keyed by the caller's spelling
+    symbols = {ticker: ticker.upper() for ticker in tickers}
+    hist = yf.download(
+        list(dict.fromkeys(symbols.values())), start=start_date, end=end_date, group_by="ticker",
+        auto_adjust=True, threads=True, progress=False, multi_level_index=True,
+        ignore_tz=False,  # keep tz-aware bars, so utc_days gives the same dates as fetch_prices
+    )
+
+    out = {}
+    for ticker, symbol in symbols.items():
+        close = hist[(symbol, "Close")].dropna() if (symbol, "Close") in hist.columns else None
+        if close is None or close.empty:
+            logging.warning("No price data from yfinance for %s", ticker)
+            continue
+        out[ticker] = pl.DataFrame({
+            "date": utc_days(close.index),
+            "close": close.to_numpy(dtype="float64"),
+        }).sort("date")
+    return out
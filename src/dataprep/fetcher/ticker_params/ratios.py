@@ -1,6 +1,19 @@
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+
 import polars as pl
 from src.dataprep.fetcher.client import fmp_client
 
+# Explicit schema: skips dtype inference over the JSON rows and drops every other field
+_RATIOS_SCHEMA = {"date": pl.Utf8} | {
+    name: pl.Float64 for name in [
+        "priceEarningsRatio", "priceToFreeCashFlowsRatio",
+        "payoutRatio", "priceToSalesRatio", "enterpriseValueMultiple",
+        "priceFairValue", "returnOnEquity", "debtEquityRatio",
+        "netProfitMargin", "dividendYield", "freeCashFlowPerShare"
+    ]
+}
+
 def fetch_ratios(ticker: str, limit:int, period: str = "annual") -> pl.DataFrame:
     """
     Fetches valuation and profitability ratios for a given ticker using FMP free-tier API.
@@ -33,16 +46,47 @@ def fetch_ratios(ticker: str, limit:int, period: str = "annual") -> pl.DataFrame
     if not data:
         return pl.DataFrame()
 
-    df = pl.DataFrame(data)
+    # keep the newest `limit` records before building anything (ISO dates compare as strings),
+    # and only build the columns we keep; FMP returns ~60 ratios per row
+    latest = heapq.nlargest(limit, data, key=lambda r: r.get("date") or "")
+    df = pl.from_dicts(latest, schema=_RATIOS_SCHEMA).with_columns(pl.col("date").str.strptime(pl.Date, format="%Y-%m-%d", strict=True, exact=True, cache=False))
 
-    if df.schema["date"] == pl.Utf8:
-        df = df.with_columns(pl.col("date").str.strptime(pl.Date, format="%Y-%m-%d"))
+    return df.sort("date")
 
-    df = df.sort("date", descending=True).head(limit).sort("date")
 
-    return df.select([
-        "date", "priceEarningsRatio", "priceToFreeCashFlowsRatio", 
-        "payoutRatio", "priceToSalesRatio", "enterpriseValueMultiple", 
-        "priceFairValue", "returnOnEquity", "debtEquityRatio", 
-        "netProfitMargin", "dividendYield", "freeCashFlowPerShare"
-    ])
+def fetch_ratios_many(tickers: list[str], limit: int, period: str = "annual", max_workers: int = 8) -> pl.DataFrame:
+    """
+    Batch variant of fetch_ratios: one long frame with a leading `ticker` column, built with a
+    single from_dicts over every response instead of one small frame per ticker.
+    Tickers the plan does not cover (or with no data) are skipped.
+    """
+    if period not in {"annual", "quarter"}:
+        raise ValueError("Period must be 'annual' or 'quarter'")
+    params = {"period": period} if period == "quarter" else {}
+    tickers = list(dict.fromkeys(tickers))
+
+    def _rows(ticker: str) -> list:
+        try:
+            return fmp_client.fetch(f"ratios/{ticker}", params) or []
+        except PermissionError as e:
+            print(f"[WARN] {e}")
+            return []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        responses = list(pool.map(_rows, tickers))
+
+    records = [row for rows in responses for row in rows]
+    if not records:
+        return pl.DataFrame()
+    owners = [ticker for ticker, rows in zip(tickers, responses) for _ in rows]
+
+    df = pl.from_dicts(records, schema=_RATIOS_SCHEMA).with_columns(
+        pl.col("date").str.strptime(pl.Date, format="%Y-%m-%d", strict=True, exact=True, cache=False),
+        pl.Series("ticker", owners, dtype=pl.Utf8),
+    )
+    return (
+        df.sort(["ticker", "date"], descending=[False, True])
+        .group_by("ticker", maintain_order=True).head(limit)
+        .sort(["ticker", "date"])
+        .select("ticker", *_RATIOS_SCHEMA)
+    )
@@ -1,38 +1,41 @@
+from datetime import date
+from functools import lru_cache
+
 import polars as pl
 from src.dataprep.fetcher.ticker_params.company import fetch_company_profile
 from src.dataprep.fetcher.ticker_params.prices import fetch_prices
-from src.dataprep.constants import SECTOR_TO_ETF, SECTOR_NORMALIZATION
+from src.dataprep.constants import NORMALIZED_SECTOR_TO_ETF
 
 
-def extract_sector_name(profile) -> str:
-    sector = ""
+def _raw_sector(profile) -> str:
+    if isinstance(profile, dict):
+        return profile.get("sector", "") or ""
+    if isinstance(profile, pl.DataFrame) and "sector" in profile.columns and profile.height > 0:
+        return profile[0, "sector"] or ""
+    return ""
+
+def _has_profile(profile) -> bool:
     if isinstance(profile, pl.DataFrame):
-        if "sector" in profile.columns and profile.height > 0:
-            sector = profile[0, "sector"]
-    elif isinstance(profile, dict):
-        sector = profile.get("sector", "")
-    
-    return SECTOR_NORMALIZATION.get(sector, sector) if sector else ""
+        return not profile.is_empty()
+    return isinstance(profile, dict) and bool(profile)
 
 def extract_sector_name(profile) -> str:
-    if isinstance(profile, pl.DataFrame):
-        if "sector" in profile.columns and profile.height > 0:
-            return profile[0, "sector"]
-    elif isinstance(profile, dict):
-        return profile.get("sector", "")
-    return ""
+    # raw provider label: the static `sector` column and its one-hot are keyed on it
+    return _raw_sector(profile)
+
+@lru_cache(maxsize=64)
+def _cached_sector_prices(etf: str, lookback_years: int, _today: date) -> pl.DataFrame:
+    # a handful of ETFs serve every ticker in a batch; keyed on today so the window rolls over
+    return fetch_prices(etf, lookback_years=lookback_years)
 
-def fetch_sector_index(ticker: str, limit: int = 3, profile:str = None) -> pl.DataFrame:
+def fetch_sector_index(ticker: str, limit: int = 3, profile: dict | pl.DataFrame | None = None) -> pl.DataFrame:
     """
     Determines the appropriate sector ETF for a stock and fetches its historical price data.
 
     If the sector is not found or unmapped, falls back to SPY.
     """
-    if profile is None or \
-        (isinstance(profile, pl.DataFrame) and profile.is_empty()) or \
-            (isinstance(profile, dict) and not profile):
+    if not _has_profile(profile):
         profile = fetch_company_profile(ticker)
-    sector_name = extract_sector_name(profile)
-    sector_etf = SECTOR_TO_ETF.get(sector_name, "SPY")  # fallback
+    sector_etf = NORMALIZED_SECTOR_TO_ETF.get(_raw_sector(profile), "SPY")  # fallback
 
-    return fetch_prices(sector_etf, lookback_years=limit)
+    return _cached_sector_prices(sector_etf, limit, date.today()).clone()
@@ -2,14 +2,17 @@ from typing import Literal
 import polars as pl
 import yfinance as yf
 
+from src.dataprep.fetcher.utils import utc_days
+
 def fetch_splits(ticker: str, mode: Literal["yfinance", "fmp"] = "yfinance") -> pl.DataFrame:
     if mode == "yfinance":
         splits = yf.Ticker(ticker).splits
         if splits.empty:
             return pl.DataFrame()
+        # UTC day as datetime64[D] maps straight onto pl.Date; no Python lists, no cast
         return pl.DataFrame({
-            "date": splits.index.to_list(),
-            "split_ratio": splits.values.tolist()
-        }).with_columns(pl.col("date").cast(pl.Date))
+            "date": utc_days(splits.index),
+            "split_ratio": splits.to_numpy(dtype="float64"),
+        }).sort("date")
 
     raise NotImplementedError("FMP does not provide split data on free tier. Use yfinance instead.")
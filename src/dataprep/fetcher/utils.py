@@ -1,5 +1,35 @@
 import datetime
 import calendar
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+def pooled_session(user_agent: str | None = None, pool_maxsize: int = 64) -> requests.Session:
+    """
+    requests.Session with a larger keep-alive pool and compression negotiated up front
+    (urllib3's ACCEPT_ENCODING also offers br/zstd when brotli/zstandard are installed).
+    Retries stay with the callers' own loops (no urllib3 Retry, to avoid double retrying).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": ACCEPT_ENCODING})
+    if user_agent:
+        session.headers.update({"User-Agent": user_agent})
+    return session
+
+
+@lru_cache(maxsize=1)
+def fmp_session() -> requests.Session:
+    """Process-wide FMP session, shared by FMPClient and fmp_get so they reuse one connection pool."""
+    session = pooled_session(user_agent="dvmax/feature-fetcher")
+    session.headers.update({"Accept": "application/json"})
+    return session
+
 
 def default_date_range(
     lookback_years: int | None = None,
@@ -46,3 +76,30 @@ def default_date_range(
     start = datetime.date(target_year, end.month, start_day)
 
     return start.isoformat(), end.isoformat()
+
+
+def parsed_date_range(
+    lookback_years: int | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    quarter_mode: bool = False
+) -> tuple[str, str, datetime.date, datetime.date]:
+    """`default_date_range` plus the parsed dates, memoized (keyed on today so it rolls over)."""
+    return _parsed_date_range(lookback_years, start_date, end_date, quarter_mode, datetime.date.today())
+
+
+@lru_cache(maxsize=256)
+def _parsed_date_range(lookback_years, start_date, end_date, quarter_mode, _today):
+    start, end = default_date_range(lookback_years, start_date, end_date, quarter_mode)
+    return start, end, datetime.date.fromisoformat(start), datetime.date.fromisoformat(end)
+
+
+def utc_days(index):
+    """
+    datetime64[D] array of a pandas DatetimeIndex's UTC dates (maps straight onto pl.Date).
+    Matches casting the tz-aware timestamps to pl.Date, so yfinance bars keep their
+    historical dates; naive indexes are taken as UTC already.
+    """
+    if index.tz is not None:
+        index = index.tz_convert(None)
+    return index.values.astype("datetime64[D]")
@@ -5,3 +5,6 @@ import pytest
 def _disable_fmp_preflight(monkeypatch):
     # Avoid network/API at import & runtime during unit tests
     monkeypatch.setenv("FMP_PREFLIGHT", "0")
+    # ...and never read/write a developer's on-disk FMP response cache
+    monkeypatch.delenv("FMP_CACHE_PATH", raising=False)
+    monkeypatch.delenv("DIVIDENDS_CACHE_DIR", raising=False)
@@ -70,6 +70,14 @@ def test_engineer_macro_features_uses_prev_year_when_current_year(tmp_path):
 def test_fetch_and_save_macro_with_mocked_worldbank(tmp_path, monkeypatch):
     # Mock WorldBankAPI.fetch_macro_indicators to avoid network
     class DummyWB:
+        closed = False
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            DummyWB.closed = True
+
         def fetch_macro_indicators(self, indicator_map, country_name, start, end):
             years = list(range(start, end + 1))
             # minimal but sufficient columns for engineer_macro_features
@@ -93,6 +101,7 @@ def test_fetch_and_save_macro_with_mocked_worldbank(tmp_path, monkeypatch):
         output_root=tmp_path.as_posix()
     )
     assert out is not None
+    assert DummyWB.closed  # API session released after the download
     assert os.path.exists(out)
     df = pl.read_parquet(out)
     # Started loop from start_year+2 => expect rows for 2022 and 2023
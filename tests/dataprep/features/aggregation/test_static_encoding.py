@@ -62,3 +62,16 @@ def test_static_ohe_projection(tmp_path, monkeypatch):
     out = pl.read_parquet(dst)
     assert out.columns == ["ticker","sector_energy","sector_other","country_usa","country_other"]
     assert str(out["sector_energy"].dtype).startswith("Float32")
+
+
+def test_encode_sectors_array_matches_dict_encoding():
+    from src.dataprep.features.engineering import (
+        encode_sector, encode_sectors, encode_countries, SECTOR_COLUMNS, COUNTRY_COLUMNS
+    )
+    sectors = ["Energy", "UNKNOWN", None, " Utilities "]
+    arr = encode_sectors(sectors)
+    assert arr.dtype.name == "int8"
+    assert arr.shape == (len(sectors), len(SECTOR_COLUMNS))
+    for row, s in zip(arr, sectors):
+        assert dict(zip(SECTOR_COLUMNS, row.tolist())) == encode_sector(s)
+    assert encode_countries(["Israel"])[0, COUNTRY_COLUMNS.index("country_israel")] == 1
@@ -92,3 +92,12 @@ def test_merge_all_feature_vectors_force(tmp_path, monkeypatch):
         _mk_dyn_row(sym, date(2024, 12, 31)).write_parquet(tmp_path / f"{sym}.parquet")
     tbr.merge_all_feature_vectors(force_merge=True)
     assert (tmp_path / "features_all_tickers_timeseries.parquet").exists()
+
+
+def test_tickers_with_missing_dates_skips_complete_tickers(tmp_path, monkeypatch):
+    monkeypatch.setattr(tbr, "OUTPUT_DIR", tmp_path.as_posix())
+    dates = [date(2023, 12, 31), date(2024, 12, 31)]
+    pl.DataFrame({"as_of": dates}).write_parquet(tmp_path / "DONE.parquet")
+    pl.DataFrame({"as_of": dates[:1]}).write_parquet(tmp_path / "PART.parquet")
+
+    assert tbr.tickers_with_missing_dates(["DONE", "PART", "NEW"], dates) == ["PART", "NEW"]
@@ -10,6 +10,7 @@ from src.dataprep.features.engineering import (
     ensure_date_column,
     compute_sector_relative_return,
     compute_payout_ratio,
+    compute_price_features_batch,
     compute_sma_delta_50_250
 )
 
@@ -166,3 +167,54 @@ def test_compute_sma_delta_handles_zero_division():
     })
     delta = compute_sma_delta_50_250(prices)
     assert delta == 0.0
+
+
+def test_compute_price_features_batch_matches_individual_functions():
+    prices = pl.DataFrame({
+        "date": [date(2023, 1, 1) + timedelta(days=i) for i in range(500)],
+        "close": [100 + (i % 37) - (i % 11) * 0.5 for i in range(500)]
+    })
+    as_of = date(2024, 3, 1)
+
+    result = compute_price_features_batch(prices, as_of, lookback_years=1)
+
+    assert result["6m_return"] == pytest.approx(compute_6m_return(prices, as_of))
+    assert result["12m_return"] == pytest.approx(compute_12m_return(prices, as_of))
+    assert result["volatility"] == pytest.approx(compute_volatility(prices))
+    assert result["max_drawdown_1y"] == pytest.approx(compute_max_drawdown(prices, 1))
+
+
+def test_compute_price_features_batch_missing_history():
+    prices = ensure_date_column(pl.DataFrame({
+        "date": ["2024-06-01"],
+        "close": [100.0]
+    }))
+    result = compute_price_features_batch(prices, datetime.date(2024, 7, 1))
+    assert result == {"6m_return": 0.0, "12m_return": 0.0, "volatility": 0.0, "max_drawdown_1y": 0.0}
+
+
+def test_compute_sector_relative_return_insufficient_window():
+    as_of = datetime.date(2024, 1, 1)
+    target_df = ensure_date_column(pl.DataFrame({
+        "date": ["2023-12-01", "2024-01-01"],
+        "close": [100, 120]
+    }))
+    sector_df = ensure_date_column(pl.DataFrame({
+        "date": ["2023-01-01", "2024-01-01"],
+        "close": [200, 210]
+    }))
+    assert compute_sector_relative_return(target_df, sector_df, 180, as_of) == 0.0
+
+
+def test_compute_payout_ratio_latest_positive_unsorted():
+    df = pl.DataFrame({
+        "date": [date(2023, 1, 1), date(2021, 1, 1), date(2022, 1, 1)],
+        "payoutRatio": [-0.1, 0.3, 0.5]
+    })
+    assert compute_payout_ratio(df) == 0.5
+    assert compute_payout_ratio(df.with_columns(pl.lit(None, dtype=pl.Float64).alias("payoutRatio"))) == 0.0
+
+
+def test_compute_sma_delta_requires_200_rows():
+    with pytest.raises(ValueError):
+        compute_sma_delta_50_250(generate_price_series(date(2023, 1, 1), 199))
@@ -1,10 +1,12 @@
 from src.dataprep.features.engineering import (
     find_nearest_price,
+    find_nearest_prices,
     ensure_date_column,
     adjust_series_for_splits
 )
 import polars as pl
 import datetime
+import pytest
 
 def test_find_nearest_price_returns_closest_value():
     df = ensure_date_column(pl.DataFrame({
@@ -64,3 +66,46 @@ def test_adjust_series_for_splits_on_dividends():
     assert adjusted[0, "dividend"] == 1.0
     assert adjusted[1, "dividend"] == 1.2
     assert adjusted[2, "dividend"] == 0.75
+
+
+def test_find_nearest_price_before_first_date_raises():
+    df = ensure_date_column(pl.DataFrame({
+        "date": ["2024-01-10", "2024-01-20"],
+        "close": [110, 120]
+    }))
+    with pytest.raises(ValueError):
+        find_nearest_price(df, datetime.date(2024, 1, 1))
+
+
+def test_ensure_date_column_reuses_parsed_frame():
+    raw = pl.DataFrame({
+        "date": ["2024-01-01", "2024-01-10"],
+        "close": [100, 110]
+    })
+    first = ensure_date_column(raw)
+    second = ensure_date_column(raw)
+    assert first.schema["date"] == pl.Date
+    assert first is second
+    assert ensure_date_column(first) is first
+
+
+def test_find_nearest_prices_matches_scalar_lookup():
+    df = ensure_date_column(pl.DataFrame({
+        "date": ["2024-01-20", "2024-01-10", "2024-01-30"],
+        "close": [120, 110, 130]
+    }))
+    targets = [datetime.date(2024, 1, 25), datetime.date(2024, 1, 10), datetime.date(2024, 2, 5)]
+    assert find_nearest_prices(df, targets) == [find_nearest_price(df, d) for d in targets] == [120, 110, 130]
+    with pytest.raises(ValueError):
+        find_nearest_prices(df, [datetime.date(2024, 1, 15), datetime.date(2024, 1, 1)])
+
+
+def test_adjust_series_for_splits_keeps_input_columns():
+    div_df = pl.DataFrame({
+        "date": [datetime.date(2023, 1, 1), datetime.date(2023, 12, 1)],
+        "dividend": [1.0, 1.0]
+    })
+    split_df = pl.DataFrame({"date": [datetime.date(2023, 7, 1)], "split_ratio": [2.0]})
+    adjusted = adjust_series_for_splits(div_df, split_df, "dividend")
+    assert adjusted.columns == ["date", "dividend"]
+    assert adjusted["dividend"].to_list() == [1.0, 0.5]
@@ -45,3 +45,24 @@ def test_compute_ebit_interest_cover():
     print(f"Expected: {expected}")
     assert "ebit_interest_cover" in out.columns
     assert out["ebit_interest_cover"].to_list() == expected
+
+
+def test_compute_net_debt_to_ebitda_missing_inputs_default_to_zero():
+    df = pl.DataFrame({
+        "totalDebt": [1000],
+        "incomeBeforeTax": [400],
+    })
+    out = compute_net_debt_to_ebitda(df)
+    assert out["net_debt_to_ebitda"].to_list() == [2.5]
+
+
+def test_compute_ebit_interest_cover_cap_and_zero_interest():
+    df = pl.DataFrame({
+        "incomeBeforeTax": [500.0, 400.0, 3000.0],
+        "interestExpense": [100.0, 0.0, 1.0],
+    })
+    out = compute_ebit_interest_cover(df, cap=1000.0)
+    assert out["ebit_interest_cover_raw"].to_list() == [5.0, None, 3000.0]
+    assert out["ebit_interest_cover"].to_list() == [5.0, float("inf"), float("inf")]
+    assert out["ebit_interest_cover_capped"].to_list() == [False, True, True]
+    assert out["has_ebit_interest_cover"].to_list() == [True, False, True]
@@ -1,8 +1,10 @@
+import datetime
 import polars as pl
 import pytest
 import numpy as np
 from src.dataprep.features.engineering.growth_features import (
-    compute_dividend_cagr, 
+    compute_dividend_cagr,
+    compute_dividend_cagrs,
     compute_eps_cagr, 
     compute_fcf_cagr,
     compute_cagr_generic
@@ -77,3 +79,28 @@ def test_compute_cagr_returns_none_when_grace_window_misses():
     # Looking back 5 years = 2019, but earliest point is 2022
     result = compute_eps_cagr(df, 5)
     assert np.isnan(result)
+
+
+def test_compute_cagr_uses_last_value_within_grace_window():
+    df = pl.DataFrame({
+        "date": ["2024-01-01", "2020-11-15", "2021-01-20", "2022-01-01"],
+        "eps": [4.0, 1.0, 2.0, 3.0]
+    }).with_columns(pl.col("date").str.strptime(pl.Date, "%Y-%m-%d"))
+
+    # 3y target is 2021-01-02; both 2020-11-15 and 2021-01-20 fall inside the 90d grace
+    cagr = compute_cagr_generic(df, "eps", 3)
+    assert cagr == pytest.approx((4.0 / 2.0) ** (1 / 3) - 1)
+
+
+def test_compute_dividend_cagrs_matches_single_horizon():
+    df = pl.DataFrame({
+        "date": ["2019-01-01", "2021-01-01", "2024-01-01"],
+        "dividend": [1.0, 1.5, 2.0]
+    })
+    splits_df = pl.DataFrame({
+        "date": [datetime.date(2020, 6, 1)],
+        "split_ratio": [2.0]
+    })
+    result = compute_dividend_cagrs(df, splits_df, years=[3, 5])
+    assert result[3] == pytest.approx(compute_dividend_cagr(df, splits_df, years=3))
+    assert result[5] == pytest.approx(compute_dividend_cagr(df, splits_df, years=5))
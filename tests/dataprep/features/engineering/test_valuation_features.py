@@ -40,3 +40,15 @@ def test_extract_latest_pe_pfcf_skips_invalid():
     })
     result = extract_latest_pe_pfcf(df)
     assert result == (32.9, 32.6)
+
+
+def test_extract_latest_pe_pfcf_unsorted_and_no_valid_rows():
+    df = pl.DataFrame({
+        "date": ["2025-03-31", "2023-12-31", "2024-12-31"],
+        "priceEarningsRatio": [30.0, 20.0, 25.0],
+        "priceToFreeCashFlowsRatio": [-1.0, 15.0, 18.0]
+    })
+    assert extract_latest_pe_pfcf(df) == (25.0, 18.0)
+
+    none_valid = df.with_columns(pl.lit(0.0).alias("priceEarningsRatio"))
+    assert extract_latest_pe_pfcf(none_valid) == (0.0, 0.0)
@@ -0,0 +1,247 @@
+import datetime
+
+import polars as pl
+
+from src.dataprep.fetcher.ticker_params.dividends import adjust_dividends_with_splits
+
+
+def test_adjust_dividends_with_splits_back_adjusts_and_keeps_order():
+    div_df = pl.DataFrame({
+        "date": [datetime.date(2024, 1, 1), datetime.date(2020, 1, 1), datetime.date(2022, 1, 1)],
+        "dividend": [1.0, 8.0, 2.0],
+    })
+    split_df = pl.DataFrame({
+        "date": [datetime.date(2023, 1, 1), datetime.date(2021, 1, 1)],
+        "split_ratio": [2.0, 2.0],
+    })
+    adjusted = adjust_dividends_with_splits(div_df, split_df)
+    assert adjusted["dividend"].to_list() == [1.0, 2.0, 1.0]
+
+
+def test_adjust_dividends_with_splits_no_splits_is_noop():
+    div_df = pl.DataFrame({"date": [datetime.date(2024, 1, 1)], "dividend": [1.0]})
+    assert adjust_dividends_with_splits(div_df, pl.DataFrame()).equals(div_df)
+
+
+def test_fetch_dividends_slices_window_inclusive(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    full = pl.DataFrame({
+        "date": [datetime.date(2020, 3, 31), datetime.date(2021, 3, 31), datetime.date(2022, 3, 31)],
+        "dividend": [1.0, 1.0, 1.0],
+    })
+    monkeypatch.setattr(div, "_cached_dividends_fmp_full", lambda t: full)
+    monkeypatch.setattr(div, "_cached_splits", lambda t, mode="yfinance": pl.DataFrame())
+
+    out = div.fetch_dividends("KO", start_date="2021-03-31", end_date="2022-03-31", grace_quarters=0, mode="fmp")
+    assert out["date"].to_list() == [datetime.date(2021, 3, 31), datetime.date(2022, 3, 31)]
+
+
+def test_fetch_dividends_empty_window_skips_splits(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    full = pl.DataFrame({"date": [datetime.date(2010, 3, 31)], "dividend": [1.0]})
+
+    def _no_splits(*a, **k):
+        raise AssertionError("splits fetched for an empty window")
+
+    monkeypatch.setattr(div, "_cached_dividends_fmp_full", lambda t: full)
+    monkeypatch.setattr(div, "_cached_splits", _no_splits)
+
+    out = div.fetch_dividends("KO", start_date="2021-03-31", end_date="2022-03-31", grace_quarters=0, mode="fmp")
+    assert out.is_empty() and out.schema == div._empty_dividends_df().schema
+
+
+def test_fmp_dividends_are_sorted_ascending(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    rows = [{"date": "2022-03-31", "dividend": 2.0}, {"date": "2021-03-31", "dividend": 1.0}]
+    monkeypatch.setattr(div.fmp_client, "fetch", lambda endpoint, params=None: {"historical": rows})
+    div._cached_dividends_fmp_full.cache_clear()
+    try:
+        df = div._cached_dividends_fmp_full("SORTTEST")
+    finally:
+        div._cached_dividends_fmp_full.cache_clear()
+    assert df["dividend"].to_list() == [1.0, 2.0]
+    assert df["date"].flags["SORTED_ASC"]
+
+
+def test_yf_dividends_frame_from_pandas(monkeypatch):
+    import pandas as pd
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    idx = pd.DatetimeIndex(["2021-04-01", "2020-04-01"], tz="America/New_York", name="Date")
+    series = pd.Series([0.6, 0.5], index=idx, name="Dividends")
+    monkeypatch.setattr(div.yf, "Ticker", lambda ticker: type("T", (), {"dividends": series})())
+    div._cached_dividends_yf_full.cache_clear()
+    try:
+        df = div._cached_dividends_yf_full("YFTEST")
+    finally:
+        div._cached_dividends_yf_full.cache_clear()
+    assert df.schema == {"date": pl.Date, "dividend": pl.Float64}
+    assert df["date"].to_list() == [datetime.date(2020, 4, 1), datetime.date(2021, 4, 1)]
+    assert df["dividend"].to_list() == [0.5, 0.6]
+
+
+def test_yf_dividends_keep_utc_dates_for_non_us_exchanges(monkeypatch):
+    import pandas as pd
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    idx = pd.DatetimeIndex(["2024-03-28 00:00"], tz="Asia/Tokyo", name="Date")
+    series = pd.Series([50.0], index=idx, name="Dividends")
+    monkeypatch.setattr(div.yf, "Ticker", lambda ticker: type("T", (), {"dividends": series})())
+    div._cached_dividends_yf_full.cache_clear()
+    try:
+        df = div._cached_dividends_yf_full("TOKYOTEST")
+    finally:
+        div._cached_dividends_yf_full.cache_clear()
+    assert df["date"].to_list() == [datetime.date(2024, 3, 27)]  # as cast(pl.Date) on the tz-aware index gave
+
+
+def test_dividends_disk_cache_survives_process_cache(monkeypatch, tmp_path):
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    calls = []
+    def fake_fetch(endpoint, params=None):
+        calls.append(endpoint)
+        return {"historical": [{"date": "2021-03-31", "dividend": 1.0}]}
+    monkeypatch.setattr(div.fmp_client, "fetch", fake_fetch)
+    monkeypatch.setenv("DIVIDENDS_CACHE_DIR", str(tmp_path))
+    div._cached_dividends_fmp_full.cache_clear()
+    try:
+        first = div._cached_dividends_fmp_full("DISKTEST")
+        div._cached_dividends_fmp_full.cache_clear()  # simulate a fresh process
+        second = div._cached_dividends_fmp_full("DISKTEST")
+    finally:
+        div._cached_dividends_fmp_full.cache_clear()
+    assert calls == ["historical-price-full/stock_dividend/DISKTEST"]
+    assert second.equals(first)
+    assert second["date"].flags["SORTED_ASC"]
+    assert (tmp_path / "divs_fmp_DISKTEST.parquet").exists()
+
+
+def test_corrupt_disk_cache_file_is_dropped_and_refetched(monkeypatch, tmp_path):
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    monkeypatch.setenv("DIVIDENDS_CACHE_DIR", str(tmp_path))
+    good = pl.DataFrame({"date": [datetime.date(2021, 3, 31)], "dividend": [1.0]})
+    path = tmp_path / "divs_yf_CORRUPT.parquet"
+    path.write_bytes(b"PAR1 truncated")
+
+    df = div._disk_cached("divs_yf_CORRUPT", lambda: good)
+
+    assert df.equals(good)
+    assert pl.read_parquet(path).equals(good)  # rewritten with the fresh fetch
+
+def test_warm_dividends_cache_fills_cache_and_tolerates_failures(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    calls = []
+    def fake_full(ticker):
+        calls.append(ticker)
+        if ticker == "BAD":
+            raise RuntimeError("boom")
+        return pl.DataFrame({"date": [datetime.date(2021, 3, 31)], "dividend": [1.0]})
+    monkeypatch.setattr(div, "_fetch_dividends_yf_full", fake_full)
+    div._cached_dividends_yf_full.cache_clear()
+    try:
+        div.warm_dividends_cache(["AAA", "BAD", "AAA", "BBB"], max_workers=2)
+        div._cached_dividends_yf_full("AAA")  # served from the warmed cache
+    finally:
+        div._cached_dividends_yf_full.cache_clear()
+    assert sorted(calls) == ["AAA", "BAD", "BBB"]
+
+
+def test_warm_splits_cache_serves_cached_splits(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    calls = []
+    splits = pl.DataFrame({"date": [datetime.date(2020, 8, 31)], "split_ratio": [4.0]})
+    monkeypatch.setattr(div, "fetch_splits", lambda ticker, mode="yfinance": calls.append(ticker) or splits)
+    div._cached_splits.cache_clear()
+    try:
+        div.warm_splits_cache(["AAPL", "TSLA"], max_workers=2)
+        assert div.cached_splits("AAPL").equals(splits)
+    finally:
+        div._cached_splits.cache_clear()
+    assert sorted(calls) == ["AAPL", "TSLA"]
+
+
+def test_warm_ticker_caches_fetches_dividends_and_splits_once(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    calls = []
+    monkeypatch.setattr(div, "_fetch_dividends_yf_full", lambda t: calls.append(("div", t)) or div._empty_dividends_df())
+    monkeypatch.setattr(div, "fetch_splits", lambda t, mode="yfinance": calls.append(("split", t)) or pl.DataFrame())
+    div._cached_dividends_yf_full.cache_clear()
+    div._cached_splits.cache_clear()
+    try:
+        div.warm_ticker_caches(["AAA", "BBB", "AAA"], max_workers=2)
+    finally:
+        div._cached_dividends_yf_full.cache_clear()
+        div._cached_splits.cache_clear()
+    assert sorted(calls) == [("div", "AAA"), ("div", "BBB"), ("split", "AAA"), ("split", "BBB")]
+
+def test_adjust_dividends_with_splits_skips_irrelevant_splits():
+    div = pl.DataFrame({"date": [datetime.date(2021, 3, 31)], "dividend": [1.0]})
+    splits = pl.DataFrame({
+        "date": [datetime.date(2010, 1, 1), datetime.date(2022, 1, 1)],
+        "split_ratio": [2.0, 1.0],
+    })
+    assert adjust_dividends_with_splits(div, splits) is div
+
+
+def test_shift_months_matches_relativedelta():
+    from dateutil.relativedelta import relativedelta
+    from src.dataprep.fetcher.ticker_params.dividends import _shift_months
+    day = datetime.date(2019, 1, 1)
+    while day < datetime.date(2021, 1, 1):
+        for months in (-6, -3, 3, 6, 12):
+            assert _shift_months(day, months) == day + relativedelta(months=months)
+        day += datetime.timedelta(days=1)
+
+
+def test_fetch_dividends_many_long_frame(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    histories = {
+        "KO": pl.DataFrame({"date": [datetime.date(2021, 6, 30)], "dividend": [0.4]}),
+        "PEP": pl.DataFrame({"date": [datetime.date(2021, 6, 30), datetime.date(2021, 9, 30)], "dividend": [1.0, 1.1]}),
+    }
+
+    def _full(t):
+        if t == "BAD":
+            raise RuntimeError("boom")
+        return histories[t]
+
+    monkeypatch.setattr(div, "_cached_dividends_yf_full", _full)
+    monkeypatch.setattr(div, "_cached_splits", lambda t, mode="yfinance": pl.DataFrame())
+
+    out = div.fetch_dividends_many(["KO", "BAD", "PEP", "KO"], start_date="2021-01-01", end_date="2021-12-31")
+    assert out.columns == ["ticker", "date", "dividend"]
+    assert out["ticker"].to_list() == ["KO", "PEP", "PEP"]
+    assert out["dividend"].to_list() == [0.4, 1.0, 1.1]
+
+
+def test_warm_min_interval_spaces_out_starts():
+    import time
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    starts = []
+    div._warm(lambda t: starts.append(time.monotonic()), ["A", "B", "C"], 3, "test", min_interval=0.05)
+    starts.sort()
+    assert all(b - a >= 0.045 for a, b in zip(starts, starts[1:]))
+
+
+def test_concurrent_saves_of_one_key_use_distinct_temp_files(monkeypatch, tmp_path):
+    import threading
+    import src.dataprep.fetcher.ticker_params.dividends as div
+    monkeypatch.setenv("DIVIDENDS_CACHE_DIR", str(tmp_path))
+    tmp_names = []
+    both_writing = threading.Barrier(2, timeout=5)  # keeps both threads alive at once
+    real_write = pl.DataFrame.write_parquet
+
+    def spy_write(self, file, **kw):
+        tmp_names.append(str(file))
+        both_writing.wait()
+        return real_write(self, file, **kw)
+
+    monkeypatch.setattr(pl.DataFrame, "write_parquet", spy_write)
+    df = pl.DataFrame({"date": [datetime.date(2021, 3, 31)], "dividend": [1.0]})
+    threads = [threading.Thread(target=div._save_cache, args=("divs_yf_RACE", df.clone())) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(set(tmp_names)) == 2
+    assert pl.read_parquet(tmp_path / "divs_yf_RACE.parquet").equals(df)
+    assert not list(tmp_path.glob("*.tmp"))
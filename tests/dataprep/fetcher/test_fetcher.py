@@ -161,4 +161,159 @@ def test_fetch_cashflow_statement_fund_returns_valid_dataframe():
 def test_fetch_company_profile_returns_sector():
     result = fetch_company_profile("AAPL")
     assert "sector" in result
-    assert isinstance(result["sector"], str)
\ No newline at end of file
+    assert isinstance(result["sector"], str)
+
+def test_fetch_company_profile_downloads_once_per_ticker(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.company as company
+    calls = []
+    def fake_fetch(endpoint, params=None):
+        calls.append(endpoint)
+        return [{"sector": "Utilities", "country": "US"}]
+    monkeypatch.setattr(company.fmp_client, "fetch", fake_fetch)
+    company._cached_company_profile.cache_clear()
+    try:
+        first = company.fetch_company_profile("PROFTEST", "fmp")
+        first["sector"] = "mutated"
+        assert company.fetch_company_profile("PROFTEST", "fmp")["sector"] == "Utilities"
+    finally:
+        company._cached_company_profile.cache_clear()
+    assert calls == ["profile/PROFTEST"]
+
+
+def test_fetch_sector_index_maps_raw_and_normalized_sectors(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.sector as sector
+    monkeypatch.setattr(sector, "fetch_prices", lambda etf, lookback_years: pl.DataFrame({"etf": [etf]}))
+    sector._cached_sector_prices.cache_clear()
+    etf = lambda profile: sector.fetch_sector_index("X", profile=profile)[0, "etf"]
+    assert etf({"sector": "Financials"}) == "XLF"
+    assert etf({"sector": "Energy"}) == "XLE"
+    assert etf({"sector": "Unknown Sector"}) == "SPY"
+    sector._cached_sector_prices.cache_clear()
+    # normalized only for the ETF lookup; the row builder keeps the raw label
+    assert sector.extract_sector_name({"sector": "Basic Materials"}) == "Basic Materials"
+
+
+def test_fetch_prices_batch_splits_download_per_ticker(monkeypatch):
+    import pandas as pd
+    import src.dataprep.fetcher.ticker_params.prices as prices
+    idx = pd.DatetimeIndex(["2024-01-03", "2024-01-02"], name="Date")
+    cols = pd.MultiIndex.from_product([["AAA", "BBB"], ["Close", "Volume"]])
+    wide = pd.DataFrame([[2.0, 1, float("nan"), 1], [1.0, 1, float("nan"), 1]], index=idx, columns=cols)
+    seen = {}
+    def fake_download(tickers, **kw):
+        seen["tickers"] = tickers
+        return wide
+    monkeypatch.setattr(prices.yf, "download", fake_download)
+
+    out = prices.fetch_prices_batch(["AAA", "BBB", "AAA"], start_date="2024-01-01", end_date="2024-01-05")
+
+    assert seen["tickers"] == ["AAA", "BBB"]
+    assert list(out) == ["AAA"]
+    assert out["AAA"].schema == {"date": pl.Date, "close": pl.Float64}
+    assert out["AAA"]["close"].to_list() == [1.0, 2.0]
+
+
+def test_fetch_prices_batch_matches_fetch_prices_dates_and_keeps_caller_spelling(monkeypatch):
+    import pandas as pd
+    import src.dataprep.fetcher.ticker_params.prices as prices
+    idx = pd.DatetimeIndex(["2024-01-03 00:00", "2024-01-04 00:00"], tz="Asia/Tokyo", name="Date")
+    cols = pd.MultiIndex.from_product([["7203.T", "SONY"], ["Close"]])
+    wide = pd.DataFrame([[1.0, 10.0], [2.0, 11.0]], index=idx, columns=cols)
+    seen = {}
+    def fake_download(tickers, **kw):
+        seen.update(kw, tickers=tickers)
+        return wide
+    monkeypatch.setattr(prices.yf, "download", fake_download)
+    hist = pd.DataFrame({"Close": [1.0, 2.0]}, index=idx)
+    monkeypatch.setattr(prices.yf, "Ticker", lambda t: type("T", (), {"history": lambda self, **kw: hist})())
+
+    out = prices.fetch_prices_batch(["7203.T", "sony"], start_date="2024-01-01", end_date="2024-01-05")
+
+    assert seen["ignore_tz"] is False
+    assert seen["tickers"] == ["7203.T", "SONY"]
+    assert list(out) == ["7203.T", "sony"]
+    single = prices.fetch_prices("7203.T", start_date="2024-01-01", end_date="2024-01-05")
+    assert out["7203.T"]["date"].to_list() == single["date"].to_list() == [
+        datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)
+    ]
+    assert out["sony"]["close"].to_list() == [10.0, 11.0]
+
+def test_fetch_prices_yfinance_frame_from_arrays(monkeypatch):
+    import pandas as pd
+    import src.dataprep.fetcher.ticker_params.prices as prices
+    idx = pd.DatetimeIndex(["2024-01-03 00:00", "2024-01-02 00:00"], tz="America/New_York", name="Date")
+    hist = pd.DataFrame({"Close": [2.0, 1.0], "Volume": [1, 1]}, index=idx)
+    monkeypatch.setattr(prices.yf, "Ticker", lambda t: type("T", (), {"history": lambda self, **kw: hist})())
+
+    df = prices.fetch_prices("AAA", start_date="2024-01-01", end_date="2024-01-05")
+
+    assert df.schema == {"date": pl.Date, "close": pl.Float64}
+    assert df["date"].to_list() == [datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)]
+    assert df["close"].to_list() == [1.0, 2.0]
+
+
+def test_fetch_prices_yfinance_keeps_utc_dates_for_non_us_exchanges(monkeypatch):
+    import pandas as pd
+    import src.dataprep.fetcher.ticker_params.prices as prices
+    # Tokyo midnight is still the previous day in UTC; dates must match the old to_list() + cast(pl.Date)
+    idx = pd.DatetimeIndex(["2024-01-03 00:00", "2024-01-04 00:00"], tz="Asia/Tokyo", name="Date")
+    hist = pd.DataFrame({"Close": [1.0, 2.0]}, index=idx)
+    monkeypatch.setattr(prices.yf, "Ticker", lambda t: type("T", (), {"history": lambda self, **kw: hist})())
+
+    df = prices.fetch_prices("7203.T", start_date="2024-01-01", end_date="2024-01-05")
+
+    assert df["date"].to_list() == pl.Series(idx.to_list()).cast(pl.Date).to_list()
+    assert df["date"].to_list() == [datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)]
+
+def test_fetch_splits_frame_from_arrays(monkeypatch):
+    import pandas as pd
+    import src.dataprep.fetcher.ticker_params.splits as splits
+    idx = pd.DatetimeIndex(["2020-08-31", "2014-06-09"], tz="America/New_York", name="Date")
+    series = pd.Series([4.0, 7.0], index=idx, name="Stock Splits")
+    monkeypatch.setattr(splits.yf, "Ticker", lambda t: type("T", (), {"splits": series})())
+
+    df = splits.fetch_splits("AAPL")
+
+    assert df.schema == {"date": pl.Date, "split_ratio": pl.Float64}
+    assert df["date"].to_list() == [datetime.date(2014, 6, 9), datetime.date(2020, 8, 31)]
+    assert df["split_ratio"].to_list() == [7.0, 4.0]
+
+
+def test_fetch_splits_keeps_utc_dates_for_non_us_exchanges(monkeypatch):
+    import pandas as pd
+    import src.dataprep.fetcher.ticker_params.splits as splits
+    idx = pd.DatetimeIndex(["2021-03-30 00:00"], tz="Asia/Tokyo", name="Date")
+    series = pd.Series([5.0], index=idx, name="Stock Splits")
+    monkeypatch.setattr(splits.yf, "Ticker", lambda t: type("T", (), {"splits": series})())
+
+    df = splits.fetch_splits("9983.T")
+
+    assert df["date"].to_list() == [datetime.date(2021, 3, 29)]
+
+
+def test_fetch_sector_index_fetches_profile_only_when_missing(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.sector as sector
+    fetched = []
+    monkeypatch.setattr(sector, "fetch_prices", lambda etf, lookback_years: pl.DataFrame({"etf": [etf]}))
+    monkeypatch.setattr(sector, "fetch_company_profile", lambda t: fetched.append(t) or {"sector": "Energy"})
+    sector._cached_sector_prices.cache_clear()
+    etf = lambda ticker, profile: sector.fetch_sector_index(ticker, profile=profile)[0, "etf"]
+    assert etf("A", {}) == "XLE"
+    assert etf("B", pl.DataFrame()) == "XLE"
+    assert etf("C", pl.DataFrame({"sector": ["Utilities"]})) == "XLU"
+    assert fetched == ["A", "B"]
+    sector._cached_sector_prices.cache_clear()
+
+
+def test_fetch_sector_index_downloads_each_etf_once(monkeypatch):
+    import src.dataprep.fetcher.ticker_params.sector as sector
+    calls = []
+    monkeypatch.setattr(sector, "fetch_prices", lambda etf, lookback_years: calls.append(etf) or pl.DataFrame({"close": [1.0]}))
+    sector._cached_sector_prices.cache_clear()
+    try:
+        for ticker in ["XOM", "CVX", "COP"]:
+            sector.fetch_sector_index(ticker, limit=3, profile={"sector": "Energy"})
+        sector.fetch_sector_index("NEE", limit=3, profile={"sector": "Utilities"})
+    finally:
+        sector._cached_sector_prices.cache_clear()
+    assert calls == ["XLE", "XLU"]
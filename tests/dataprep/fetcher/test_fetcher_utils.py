@@ -1,4 +1,4 @@
-from src.dataprep.fetcher.utils import default_date_range
+from src.dataprep.fetcher.utils import default_date_range, parsed_date_range
 import datetime
 import calendar
 
@@ -39,3 +39,17 @@ def test_default_date_range_returns_span_clamped_to_valid_day():
     assert start.month == end.month
     expected_last_day = calendar.monthrange(start.year, start.month)[1]
     assert 1 <= start.day <= expected_last_day
+
+
+def test_parsed_date_range_matches_default_and_parses():
+    start, end, start_dt, end_dt = parsed_date_range(start_date="2020-01-31", end_date="2021-01-31")
+    assert (start, end) == default_date_range(start_date="2020-01-31", end_date="2021-01-31")
+    assert (start_dt, end_dt) == (datetime.date(2020, 1, 31), datetime.date(2021, 1, 31))
+    assert parsed_date_range(5, quarter_mode=True)[:2] == default_date_range(5, quarter_mode=True)
+
+
+def test_fmp_session_negotiates_compression_and_json():
+    from src.dataprep.fetcher.utils import fmp_session
+    headers = fmp_session().headers
+    assert "gzip" in headers["Accept-Encoding"]
+    assert headers["Accept"] == "application/json"
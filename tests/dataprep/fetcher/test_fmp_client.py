@@ -1,13 +1,18 @@
+import json
 import requests
 import pytest
 from src.dataprep.fetcher._fmp_client import fmp_get, FMPAuthError, FMPRateLimitError
 
 class R:  # tiny fake Response
-    def __init__(self, status_code, json_data):
+    def __init__(self, status_code, json_data, headers=None):
         self.status_code = status_code
         self._json_data = json_data
+        self.headers = headers or {}
     def json(self):
         return self._json_data
+    @property
+    def content(self):
+        return json.dumps(self._json_data).encode()
     def raise_for_status(self):
         if self.status_code >= 400:
             raise requests.HTTPError(f"{self.status_code} error")
@@ -34,3 +39,127 @@ def test_fmp_ok(monkeypatch):
         return R(200, [{"ok":1}])
     monkeypatch.setattr("src.dataprep.fetcher._fmp_client._s.get", fake_get)
     assert fmp_get("/x", {}) == [{"ok":1}]
+
+
+def test_fmp_client_fetch_many_batches_and_demuxes(monkeypatch):
+    from src.dataprep.fetcher.base import FMPClient
+
+    class JR(R):
+        headers = {"Content-Type": "application/json"}
+        text = "[]"
+
+    urls = []
+    def fake_get(url, params=None, timeout=None):
+        urls.append(url)
+        symbols = url.rsplit("/", 1)[-1].split(",")
+        return JR(200, [{"symbol": s, "price": 1.0} for s in symbols])
+
+    monkeypatch.setenv("FMP_API_KEY", "dummy")
+    client = FMPClient()
+    monkeypatch.setattr(client.session, "get", fake_get)
+    out = client.fetch_many("quote", ["AAPL", "MSFT", "KO", "AAPL"], batch_size=2)
+    assert urls == [f"{client.base_url}/quote/AAPL,MSFT", f"{client.base_url}/quote/KO"]
+    assert set(out) == {"AAPL", "MSFT", "KO"}
+    assert out["KO"] == [{"symbol": "KO", "price": 1.0}]
+    assert client.request_count == 2
+
+
+def test_fmp_get_disk_cache(monkeypatch, tmp_path):
+    calls = {"n": 0}
+    def fake_get(url, params=None, timeout=None):
+        calls["n"] += 1
+        return R(200, [{"close": 1.0}])
+    monkeypatch.setattr("src.dataprep.fetcher._fmp_client._s.get", fake_get)
+    monkeypatch.setenv("FMP_CACHE_PATH", str(tmp_path / "fmp_cache.sqlite"))
+
+    params = {"from": "2020-01-01", "to": "2020-12-31"}
+    assert fmp_get("/api/v3/historical-price-full/AAPL", params) == [{"close": 1.0}]
+    assert fmp_get("/api/v3/historical-price-full/AAPL", dict(params)) == [{"close": 1.0}]
+    assert calls["n"] == 1
+    fmp_get("/api/v3/historical-price-full/AAPL", {"from": "2021-01-01", "to": "2021-12-31"})
+    assert calls["n"] == 2
+
+
+def test_fmp_get_honors_retry_after(monkeypatch):
+    responses = [R(429, {}, headers={"Retry-After": "7"}), R(200, [{"ok": 1}])]
+    sleeps = []
+    monkeypatch.setattr("src.dataprep.fetcher._fmp_client._s.get", lambda url, params=None, timeout=None: responses.pop(0))
+    monkeypatch.setattr("src.dataprep.fetcher._fmp_client.time.sleep", sleeps.append)
+    assert fmp_get("/api/v3/quote/AAPL", {}) == [{"ok": 1}]
+    assert sleeps == [7.0]
+
+
+def test_fmp_retry_delay_caps_and_parses_http_dates():
+    from email.utils import format_datetime
+    from datetime import datetime, timedelta, timezone
+    from src.dataprep.fetcher._fmp_client import _retry_delay
+    resp = lambda value: R(429, {}, headers={"Retry-After": value})
+    assert _retry_delay(resp("86400"), 1.0) == 60.0
+    assert _retry_delay(resp("0"), 1.0) == 1.0
+    soon = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25.0 <= _retry_delay(resp(soon), 1.0) <= 30.0
+    assert _retry_delay(resp("Wed, 21 Oct 2015 07:28:00 GMT"), 1.0) == 1.0  # already passed
+    assert _retry_delay(resp("Wed, 21 Oct 2099 07:28:00 GMT"), 1.0) == 60.0
+    assert 1.0 <= _retry_delay(resp("soon-ish"), 1.0) <= 1.5  # unparseable -> backoff
+
+def test_fmp_client_backoff_full_jitter(monkeypatch):
+    from src.dataprep.fetcher.base import FMPClient
+    sleeps = []
+    monkeypatch.setattr("src.dataprep.fetcher.base.time.sleep", sleeps.append)
+    client = FMPClient()
+    for attempt in range(10):
+        client._sleep_backoff(attempt, None)
+    assert all(0 <= s <= min(30, 0.5 * 2 ** a) for a, s in enumerate(sleeps))
+    sleeps.clear()
+    client._sleep_backoff(0, "3")
+    assert 3 <= sleeps[0] <= 4
+
+
+def test_http_cache_ttl_by_endpoint():
+    from src.dataprep.fetcher import _http_cache
+    base = "https://financialmodelingprep.com/api/v3"
+    assert _http_cache._ttl(f"{base}/profile/AAPL", {}) == 24 * 3600
+    assert _http_cache._ttl(f"{base}/historical-price-full/stock_dividend/AAPL", {}) == 6 * 3600
+    assert _http_cache._ttl(f"{base}/quote/AAPL,MSFT", {}) == 60
+    assert _http_cache._ttl(f"{base}/historical-price-full/AAPL", {"to": "2020-12-31"}) is None
+
+
+def test_count_requests_is_per_context(monkeypatch):
+    import contextvars
+    from concurrent.futures import ThreadPoolExecutor
+    from src.dataprep.fetcher.base import FMPClient, count_requests
+    client = FMPClient()
+    monkeypatch.setattr(client.session, "get", lambda url, params=None, timeout=None: R(200, [{"ok": 1}]))
+
+    def one_caller(n):
+        with count_requests() as tally, ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(contextvars.copy_context().run, client.fetch, f"quote/T{i}") for i in range(n)]
+            for f in futures:
+                f.result()
+        return tally[0]
+
+    with ThreadPoolExecutor(max_workers=2) as outer:
+        counts = list(outer.map(one_caller, [3, 5]))
+    assert counts == [3, 5]
+    assert client.request_count == 8
+
+
+def test_http_cache_reuses_connection_per_thread(monkeypatch, tmp_path):
+    import sqlite3
+    import threading
+    from src.dataprep.fetcher import _http_cache
+    connects = []
+    real_connect = sqlite3.connect
+    monkeypatch.setattr(_http_cache.sqlite3, "connect", lambda *a, **kw: connects.append(a[0]) or real_connect(*a, **kw))
+    monkeypatch.setenv("FMP_CACHE_PATH", str(tmp_path / "reuse.sqlite"))
+    url = "https://financialmodelingprep.com/api/v3/profile/AAPL"
+
+    _http_cache.put(url, {}, [{"a": 1}])
+    for _ in range(5):
+        assert _http_cache.get(url, {}) == [{"a": 1}]
+    assert len(connects) == 2  # schema init + this thread's connection
+
+    other = threading.Thread(target=lambda: _http_cache.get(url, {}))
+    other.start()
+    other.join()
+    assert len(connects) == 3  # another thread gets its own; schema not re-created
@@ -1,3 +1,5 @@
+import json
+
 from src.dataprep.fetcher.macro import WorldBankAPI
 from src.dataprep.constants import MACRO_INDICATORS
 
@@ -11,3 +13,44 @@ def test_fetch_core_macro_indicators():
     assert df.index.min().year >= 2015, "Start year is earlier than requested"
     assert df.index.max().year <= 2022, "End year is later than requested"
     assert df.dropna().shape[0] > 0, "No rows with complete data"
+
+
+class _FakeResp:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+    def raise_for_status(self):
+        pass
+
+
+def test_fetch_macro_indicators_offline(monkeypatch):
+    monkeypatch.setattr(WorldBankAPI, "_load_country_code_map", lambda self: {"Testland": "TL"})
+    api = WorldBankAPI()
+    data = {
+        "GDP": [{"date": "2021", "value": 2.0}, {"date": "2020", "value": 1.0}],
+        "CPI": [{"date": "2021", "value": None}, {"date": "2020", "value": 3.0}],
+    }
+    monkeypatch.setattr(api.session, "get", lambda url, params=None, **kw: _FakeResp([{}, data[url.rsplit("/", 1)[-1]]]))
+
+    df = api.fetch_macro_indicators({"GDP": "gdp", "CPI": "cpi"}, "Testland", start=2020, end=2021)
+
+    assert list(df.columns) == ["gdp", "cpi"]
+    assert [d.year for d in df.index] == [2020, 2021]
+    assert df["gdp"].tolist() == [1.0, 2.0]
+    assert df.loc["2020-01-01", "cpi"] == 3.0 and df["cpi"].isna().iloc[1]
+
+
+def test_country_code_map_fetched_once(monkeypatch):
+    import requests
+    import src.dataprep.fetcher.macro as macro
+    calls = []
+    def fake_get(self, url, params=None, **kw):
+        calls.append(url)
+        return _FakeResp([{}, [{"name": "Testland", "id": "TL"}]])
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    macro._country_code_map.cache_clear()
+    try:
+        assert WorldBankAPI().get_country_code("Testland") == "TL"
+        assert WorldBankAPI().get_country_code("Testland") == "TL"
+    finally:
+        macro._country_code_map.cache_clear()
+    assert calls == [f"{macro.BASE_URL}/country"]
@@ -0,0 +1,38 @@
+import datetime
+
+import src.dataprep.fetcher.ticker_params.ratios as ratios
+
+
+def test_fetch_ratios_keeps_only_selected_columns(monkeypatch):
+    rows = [
+        {"date": f"{y}-12-31", "priceEarningsRatio": 10.0 + y % 10, "dividendYield": 0.02, "unused": "x"}
+        for y in range(2018, 2024)
+    ]
+    monkeypatch.setattr(ratios.fmp_client, "fetch", lambda endpoint, params=None: rows)
+
+    df = ratios.fetch_ratios("AAPL", limit=3)
+
+    assert df.columns == list(ratios._RATIOS_SCHEMA)
+    assert df["priceEarningsRatio"].dtype == ratios.pl.Float64
+    assert df["date"].to_list() == [datetime.date(y, 12, 31) for y in (2021, 2022, 2023)]
+    assert df["payoutRatio"].null_count() == 3
+
+
+def test_fetch_ratios_many_stacks_tickers(monkeypatch):
+    calls = []
+    def fake_fetch(endpoint, params=None):
+        ticker = endpoint.split("/")[-1]
+        calls.append(ticker)
+        if ticker == "NONE":
+            return []
+        return [{"date": f"{y}-12-31", "priceEarningsRatio": float(y)} for y in range(2019, 2024)]
+    monkeypatch.setattr(ratios.fmp_client, "fetch", fake_fetch)
+
+    df = ratios.fetch_ratios_many(["MSFT", "NONE", "AAPL", "MSFT"], limit=2)
+    assert sorted(calls) == ["AAPL", "MSFT", "NONE"]  # duplicates fetched once
+
+    assert df.columns == ["ticker", *ratios._RATIOS_SCHEMA]
+    assert df["ticker"].to_list() == ["AAPL", "AAPL", "MSFT", "MSFT"]
+    assert df["priceEarningsRatio"].to_list() == [2022.0, 2023.0, 2022.0, 2023.0]
+    single = ratios.fetch_ratios("AAPL", limit=2)
+    assert df.filter(ratios.pl.col("ticker") == "AAPL").drop("ticker").equals(single)
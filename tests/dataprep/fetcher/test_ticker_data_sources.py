@@ -0,0 +1,33 @@
+import src.dataprep.fetcher.ticker_data_sources as tds
+
+
+def test_fetch_all_per_ticker_collects_every_source(monkeypatch):
+    profile = {"sector": "Energy", "country": "USA"}
+    monkeypatch.setattr(tds, "fetch_company_profile", lambda t: profile)
+    for name in ["fetch_prices", "fetch_dividends", "fetch_ratios",
+                 "fetch_balance_sheet_fund", "fetch_income_statement_fund", "cached_splits"]:
+        monkeypatch.setattr(tds, name, lambda t, _n=name, **kw: (_n, t, kw))
+    monkeypatch.setattr(tds, "fetch_sector_index", lambda t, **kw: ("sector", kw["profile"]))
+
+    out = tds.fetch_all_per_ticker("XOM", div_lookback_years=5, other_lookback_years=3)
+
+    assert out["profile"] is profile
+    assert out["prices"] == ("fetch_prices", "XOM", {"lookback_years": 5})
+    assert out["ratios"] == ("fetch_ratios", "XOM", {"limit": 3})
+    assert out["splits"] == ("cached_splits", "XOM", {})
+    assert out["dividends"] == ("fetch_dividends", "XOM", {"lookback_years": 5, "splits_df": out["splits"]})
+    assert out["sector_index"] == ("sector", profile)
+    assert set(out) == {"prices", "dividends", "ratios", "balance", "income", "profile", "splits", "sector_index"}
+
+
+def test_fetch_all_batch_skips_failed_tickers(monkeypatch):
+    def fake_fetch_all(ticker, div_lookback_years, other_lookback_years):
+        if ticker == "BAD":
+            raise RuntimeError("no data")
+        return {"ticker": ticker, "years": (div_lookback_years, other_lookback_years)}
+    monkeypatch.setattr(tds, "fetch_all_per_ticker", fake_fetch_all)
+
+    out = tds.fetch_all_batch(["AAA", "BAD", "BBB"], 5, 3, max_concurrency=2)
+
+    assert list(out) == ["AAA", "BBB"]
+    assert out["BBB"] == {"ticker": "BBB", "years": (5, 3)}
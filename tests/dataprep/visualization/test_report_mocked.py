@@ -29,7 +29,7 @@ def get_random_prices():
 @patch("src.dataprep.fetcher.ticker_data_sources.fetch_balance_sheet_fund")
 @patch("src.dataprep.fetcher.ticker_data_sources.fetch_income_statement_fund")
 @patch("src.dataprep.fetcher.ticker_data_sources.fetch_company_profile")
-@patch("src.dataprep.fetcher.ticker_data_sources.fetch_splits")
+@patch("src.dataprep.fetcher.ticker_data_sources.cached_splits")
 def test_print_report_with_mocked_data(
     mock_splits, mock_profile, mock_income, mock_balance,
     mock_ratios, mock_dividends, mock_prices